@@ -16,11 +16,10 @@ from pathlib import Path
 from typing import Optional
 
 import typer
-import yaml
 from loguru import logger
 from rich.console import Console
 
-from shared_modules.config import DEFAULT_CONFIG_PATH, Config
+from shared_modules.config import DEFAULT_CONFIG_PATH, Config, load_yaml_config
 
 app = typer.Typer(
     name="wegpiraten",
@@ -43,8 +42,8 @@ def get_config(config_path: Optional[Path] = None) -> Config:
 def ensure_database_exists(config_path: Path) -> None:
     """Erstellt die SQLite-Datenbank, falls sie fehlt."""
     try:
-        with open(config_path, "r") as handle:
-            raw_config = yaml.safe_load(handle) or {}
+        # Gleicher Cache wie Config: die Datei wird pro Lauf nur einmal geparst
+        raw_config = load_yaml_config(config_path)
     except Exception as exc:
         logger.error(f"Konfiguration konnte nicht gelesen werden: {exc}")
         raise
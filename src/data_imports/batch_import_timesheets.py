@@ -35,6 +35,7 @@ from __future__ import annotations
 
 import re
 import sqlite3
+import sys
 from copy import copy
 from datetime import date, datetime
 from pathlib import Path
@@ -47,6 +48,7 @@ from openpyxl.styles import Protection
 from openpyxl.worksheet.worksheet import Worksheet
 from pydantic import BaseModel, ValidationError
 
+from cli import app
 from pydantic_models.data.invoice_row_model import InvoiceRowModel
 from pydantic_models.data.row_mapping import RowMapping
 from pydantic_models.data.timesheet_import_profile import TimeSheetImportProfile
@@ -156,17 +158,13 @@ class TimeSheetsImporter:
         self.masterdata_stem = Path(self.config.database.db_name or "").stem
 
         prj_root = Path(self.config.structure.prj_root)
-        data_dir = prj_root / (getattr(self.config.structure, "local_data_path", None) or "data")
+        data_dir = prj_root / (self.config.structure.local_data_path or "data")
         self.db_path = data_dir / self.config.database.sqlite_db_name
-        self.output_dir = ensure_dir(prj_root / (getattr(self.config.structure, "output_path", None) or "output"))
-        self.log_dir = ensure_dir(prj_root / (getattr(self.config.structure, "log_path", None) or ".logs"))
+        self.output_dir = ensure_dir(prj_root / (self.config.structure.output_path or "output"))
+        self.log_dir = ensure_dir(prj_root / (self.config.structure.log_path or ".logs"))
 
-        cfg_imports_path = getattr(self.config.structure, "imports_path", None) or self.config.get(
-            "structure.imports_path", None
-        )
-        cfg_done_path = getattr(self.config.structure, "done_path", None) or self.config.get(
-            "structure.done_path", None
-        )
+        cfg_imports_path = self.config.structure.imports_path or self.config.get("structure.imports_path", None)
+        cfg_done_path = self.config.structure.done_path or self.config.get("structure.done_path", None)
         default_import = prj_root / "import"
         fallback_local = prj_root / "data_imports"
         default_windows = Path(r"C:\Users\micro\OneDrive\Shared\Beatus\Wegpiraten Unterlagen\data_imports")
@@ -378,6 +376,11 @@ class TimeSheetsImporter:
         CREATE INDEX IF NOT EXISTS idx_service_data_client_date
         ON service_data (client_id, service_date)
         """
+        # Monatsfilter der Faktura (service_date BETWEEN ? AND ?) ohne Client-Filter
+        date_index_sql = """
+        CREATE INDEX IF NOT EXISTS idx_service_data_date
+        ON service_data (service_date)
+        """
         with sqlite3.connect(self.db_path) as conn:
             conn.execute("PRAGMA foreign_keys = ON")
             conn.execute(sql)
@@ -394,6 +397,7 @@ class TimeSheetsImporter:
             conn.execute(drop_legacy_client_date_index_sql)
             conn.execute(drop_legacy_employee_unique_index_sql)
             conn.execute(client_date_index_sql)
+            conn.execute(date_index_sql)
             conn.commit()
 
     def _reset_service_data(self) -> None:
@@ -1152,18 +1156,14 @@ class TimeSheetsImporter:
         return total
 
 
-def main() -> None:
+def main(argv: Optional[List[str]] = None) -> None:
     """
     Einstiegspunkt:
-    - Lädt zentrale Config (Pydantic-validiert).
-    - Initialisiert Importer.
-    - Führt den Batch-Import aus und schreibt Sammel-Excel ins Output-Verzeichnis.
+    Delegiert an den CLI-Befehl `import-sheets` (Config, Importer, Sammel-Excel im Output-Verzeichnis);
+    der Leistungsmonat wird als Argument übergeben, z. B. `2025-10 [--no-reset]`.
     """
-    config_path = Path(__file__).parents[2] / ".config" / "wegpiraten_config.yaml"
-    config = Config(config_path)  # Singleton, lädt und validiert, setzt Logging
-
-    importer = TimeSheetsImporter(config)
-    importer.run("2025-10")  # optional: importer.run("2025-10", reset=False)
+    args = sys.argv[1:] if argv is None else argv
+    app(args=["import-sheets", *args], prog_name="batch_import_timesheets")
 
 
 if __name__ == "__main__":
@@ -14,37 +14,42 @@ from typing import Any, Dict, List, Optional, Tuple
 import openpyxl
 import pandas as pd
 from loguru import logger
+from openpyxl.utils.cell import range_boundaries
+from openpyxl.workbook.workbook import Workbook
 
 from pydantic_models.config.entity_model_config import FieldConfig
 from shared_modules.config import Config
-from shared_modules.utils import ensure_dir
+from shared_modules.utils import ensure_dir, get_type_from_str
+
+# Python-Typnamen (als String) → SQLite-Typen
+_SQL_TYPES: Dict[str, str] = {"str": "TEXT", "float": "REAL", "int": "INTEGER", "bool": "INTEGER"}
 
 
 def sql_type(py_type: str) -> str:
     """Mapping von Python-Typnamen (als String) auf SQLite-Typen."""
-    return {"str": "TEXT", "float": "REAL", "int": "INTEGER", "bool": "INTEGER"}.get(py_type, "TEXT")
+    return _SQL_TYPES.get(py_type, "TEXT")
 
 
-def get_type_from_str(type_str: str) -> type:
-    """Wandelt einen Typnamen als String in einen Python-Typ um."""
-    mapping: Dict[str, type] = {
-        "str": str,
-        "float": float,
-        "int": int,
-        "bool": bool,
-    }
-    return mapping.get(type_str, str)
+def resolve_field_types(mapping: Dict[str, FieldConfig]) -> Dict[str, type]:
+    """Löst die Python-Typen aller gemappten Felder einmal pro Tabelle auf (excel_column → Typ)."""
+    return {excel_col: get_type_from_str(entry.type) for excel_col, entry in mapping.items()}
 
 
-def map_row(row: pd.Series, mapping: Dict[str, FieldConfig], required_fields: list[str]) -> Dict[str, Any]:
+def map_row(
+    row: pd.Series,
+    mapping: Dict[str, FieldConfig],
+    required_fields: list[str],
+    field_types: Dict[str, type],
+) -> Dict[str, Any]:
     """
     Mappt die Felder einer Zeile gemäß dem Mapping-Dict aus der Config.
     Führt erforderliche Typkonvertierungen durch und ergänzt fehlende Felder mit None.
+    Die Feldtypen kommen vorberechnet aus resolve_field_types, statt sie pro Zelle aufzulösen.
     """
     result: Dict[str, Any] = {}
     for excel_col, entry in mapping.items():
         field_name = entry.name
-        field_type = get_type_from_str(entry.type)
+        field_type = field_types[excel_col]
         value = row.get(excel_col)
         # Prüfe auf leere Felder (NaN, None oder leerer String)
         if (
@@ -82,21 +87,20 @@ def map_row(row: pd.Series, mapping: Dict[str, FieldConfig], required_fields: li
     return result
 
 
-def read_excel_table(file_path: Path, table_name: str) -> pd.DataFrame:
+def read_excel_table(file_path: Path, table_name: str, workbook: Optional[Workbook] = None) -> pd.DataFrame:
     """
     Liest eine benannte Tabelle (Excel Table, nicht Sheet!) aus einer Excel-Datei als DataFrame.
+    Ist bereits ein geladenes Workbook vorhanden, wird dieses verwendet statt die Datei erneut zu parsen.
     """
-    wb = openpyxl.load_workbook(file_path, data_only=True)
+    wb = workbook if workbook is not None else openpyxl.load_workbook(file_path, data_only=True)
     for ws in wb.worksheets:
         if table_name in ws.tables:
             table = ws.tables[table_name]
             ref = table.ref  # z.B. 'A1:F20'
-            from openpyxl.utils.cell import range_boundaries
-
             min_col, min_row, max_col, max_row = range_boundaries(ref)
-            data = []
-            for row in ws.iter_rows(min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col):
-                data.append([cell.value for cell in row])
+            data = list(
+                ws.iter_rows(min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col, values_only=True)
+            )
             df = pd.DataFrame(data[1:], columns=data[0])  # Erste Zeile als Header
             return df
     raise ValueError(f"Tabelle {table_name} nicht gefunden.")
@@ -168,6 +172,7 @@ def import_entity_data(
     target_table: str,
     fields: list[FieldConfig],
     foreign_keys: Optional[list[tuple[str, str, str]]] = None,
+    workbook: Optional[Workbook] = None,
 ) -> Tuple[int, int, int, Dict[str, List[str]]]:
     """
     Liest alle Daten aus der angegebenen Excel-Tabelle, mappt die Felder und schreibt sie in die Zieltabelle.
@@ -175,7 +180,7 @@ def import_entity_data(
     """
     logger.info(f"Importiere Excel-Tabelle {excel_table_name} → {target_table}")
     try:
-        excel_table = read_excel_table(source_excel, excel_table_name)
+        excel_table = read_excel_table(source_excel, excel_table_name, workbook=workbook)
     except Exception as e:
         logger.error(f"Fehler beim Lesen der Excel-Tabelle {excel_table_name}: {e}")
         return 0, 0, 0, {"inserted": [], "updated": [], "deactivated": []}
@@ -183,6 +188,7 @@ def import_entity_data(
     # Mapping: excel_column → FieldConfig
     mapping = {f.excel_column: f for f in fields if f.excel_column}
     required_fields = [f.name for f in fields]
+    field_types = resolve_field_types(mapping)
 
     pk_fields = [field.name for field in fields if field.primary_key]
     records: List[Dict[str, Any]] = []
@@ -191,7 +197,7 @@ def import_entity_data(
         if row.isnull().all():
             continue
         try:
-            mapped = map_row(row, mapping, required_fields)
+            mapped = map_row(row, mapping, required_fields, field_types)
             pk_key = _pk_key(mapped, pk_fields)
             if pk_key is None:
                 logger.error("Datensatz ohne Primärschlüssel in {} übersprungen.", target_table)
@@ -418,9 +424,9 @@ def run_import(config: Config, source_override: Optional[Path] = None) -> int:
     """
     # Pfade aus Config
     prj_root = Path(config.structure.prj_root)
-    imports_path = Path(getattr(config.structure, "imports_path", None) or "import")
+    imports_path = Path(config.structure.imports_path or "import")
     local_data_path = config.structure.local_data_path or "data"
-    done_path_cfg = getattr(config.structure, "done_path", None) or "done"
+    done_path_cfg = config.structure.done_path or "done"
 
     # Dateinamen
     sqlite_db_name = config.database.sqlite_db_name or "Wegpiraten Datenbank.sqlite3"
@@ -444,6 +450,9 @@ def run_import(config: Config, source_override: Optional[Path] = None) -> int:
 
     logger.info(f"Importiere Stammdaten von {source_excel_path} nach {target_db_path}")
 
+    # Quelldatei nur einmal parsen und für alle Tabellen wiederverwenden
+    source_workbook = openpyxl.load_workbook(source_excel_path, data_only=True)
+
     total_imported = 0
     report: Dict[str, Dict[str, List[str]]] = {}
     with sqlite3.connect(target_db_path) as target_conn:
@@ -478,6 +487,7 @@ def run_import(config: Config, source_override: Optional[Path] = None) -> int:
                     target_table=target_table,
                     fields=fields,
                     foreign_keys=FOREIGN_KEY_MAPPINGS.get(target_table),
+                    workbook=source_workbook,
                 )
                 total_imported += inserted + updated
                 report[entity_name] = details
@@ -486,6 +496,8 @@ def run_import(config: Config, source_override: Optional[Path] = None) -> int:
 
         _write_report(config, report)
 
+    source_workbook.close()
+
     if source_excel_path.parent.resolve() == imports_path.resolve():
         done_dir_base = Path(done_path_cfg)
         done_dir = ensure_dir(done_dir_base if done_dir_base.is_absolute() else (prj_root / done_dir_base))
@@ -1,51 +1,18 @@
 import sys
-from pathlib import Path
+from typing import List, Optional
 
-from loguru import logger
+from cli import app
 
-# Importiere die Pydantic-basierte Singleton-Konfiguration
-from shared_modules.config import Config
 
-from .modules.invoice_filter import InvoiceFilter  # Erwartet typisierte Filterdaten
-from .modules.invoice_processor import InvoiceProcessor  # Erwartet Pydantic-Konfiguration
-
-
-def main() -> None:
+def main(argv: Optional[List[str]] = None) -> None:
     """
     Einstiegspunkt für den Rechnungsprozess.
-    Lädt die Konfiguration (validiert mit Pydantic), initialisiert Filter und startet die Verarbeitung.
-    Nutzt ausschließlich Pydantic-Modelle für Konfiguration und Filter.
+    Delegiert an den CLI-Befehl `invoice` (gemeinsamer Start: Config, Logging, Filter, Verarbeitung),
+    damit Argumentprüfung und Ablauf nur an einer Stelle gepflegt werden.
+    Aufruf: python -m invoices.invoice_batch 02.2026 [--clients C1017,C1038]
     """
-    # Pfad zur YAML-Konfigurationsdatei bestimmen (typisiert mit pathlib.Path)
-    config_path: Path = Path(__file__).parent.parent.parent / ".config" / "wegpiraten_config.yaml"
-
-    # Abrechnungsmonat als Argument übergeben
-    # TODO: Später über GUI oder Web-Formular ein ganzes Filter-Objekt übergeben
-    if len(sys.argv) > 1:
-        invoice_month: str = sys.argv[1]
-    else:
-        print("Bitte Abrechnungsmonat als Argument übergeben (z.B. 08.2025)")
-        invoice_month = "02.2026"
-        # sys.exit(1)
-
-    # Filter-Objekt für die Rechnungsverarbeitung (kann später erweitert werden)
-    filter_obj: InvoiceFilter = InvoiceFilter(invoice_month=invoice_month)
-
-    # Konfiguration laden und validieren (Pydantic übernimmt die Validierung)
-    config_obj: Config = Config(config_path)
-
-    # Logdatei und Logverzeichnis werden automatisch durch config.setup_logger() eingerichtet
-    # (Logger ist bereits durch Config initialisiert, keine doppelte Konfiguration nötig)
-    logger.info("Starte Rechnungsprozess...")
-
-    try:
-        # Die Entitäten und erwarteten Spalten werden jetzt segmentiert aus der config geladen
-        # InvoiceProcessor erhält die validierte Pydantic-Konfiguration
-        processor: InvoiceProcessor = InvoiceProcessor(config=config_obj, filter=filter_obj)
-        processor.run()
-        logger.success("Rechnungsprozess erfolgreich abgeschlossen.")
-    except Exception as e:
-        logger.exception(f"Fehler im Rechnungsprozess: {e}")
+    args = sys.argv[1:] if argv is None else argv
+    app(args=["invoice", *args], prog_name="invoice_batch")
 
 
 if __name__ == "__main__":
@@ -1,3 +1,4 @@
+from itertools import islice
 from pathlib import Path
 from typing import Optional, cast
 
@@ -40,19 +41,22 @@ class DataLoader:
         Returns:
             pd.DataFrame: Gefilterte Daten als DataFrame.
         """
-        work_book = load_workbook(db, data_only=True)
-        work_sheet = work_book[sheet] if sheet else work_book.active
-        if work_sheet is None:
-            raise ValueError(f"Kein aktives Sheet in {db}")
+        # read_only streamt die Zellen, statt den kompletten Zellgraphen im Speicher aufzubauen
+        work_book = load_workbook(db, data_only=True, read_only=True, keep_links=False)
+        try:
+            work_sheet = work_book[sheet] if sheet else work_book.active
+            if work_sheet is None:
+                raise ValueError(f"Kein aktives Sheet in {db}")
 
-        # Die ersten drei Zeilen sind Metadaten und werden übersprungen
-        data = work_sheet.values
-        for _ in range(3):
-            next(data)
-        # Die vierte Zeile enthält die Spaltennamen (ohne die erste Spalte)
-        columns = next(data)[1:]
-        # Die eigentlichen Daten ab der zweiten Spalte
-        df = pd.DataFrame((row[1:] for row in data), columns=columns)
+            # Die ersten drei Zeilen sind Metadaten und werden übersprungen
+            data = islice(work_sheet.iter_rows(values_only=True), 3, None)
+            # Die vierte Zeile enthält die Spaltennamen (ohne die erste Spalte)
+            columns = next(data)[1:]
+            # Die eigentlichen Daten ab der zweiten Spalte
+            df = pd.DataFrame.from_records((row[1:] for row in data), columns=columns)
+        finally:
+            # Im read_only-Modus hält das Workbook die Datei offen, bis es geschlossen wird
+            work_book.close()
 
         # Alle Felder mit "(Leer)" durch "" ersetzen
         df = df.replace("(Leer)", "")
@@ -88,14 +92,9 @@ class DataLoader:
             ValueError: Falls erwartete Spalten fehlen.
             TypeError: Falls Summenfelder nicht numerisch sind.
         """
-        # Extrahiere die erwarteten Spaltennamen aus der Pydantic-Konfiguration
+        # Erwartete Spaltennamen werden beim Laden der Konfiguration einmalig als frozenset abgeleitet
         expected_columns_model: ExpectedColumnsConfig = self.config.get_expected_columns()
-        expected_columns = set()
-        for section in ["payer", "client", "general"]:
-            # Die Konfiguration liefert jetzt Pydantic-Modelle, daher Zugriff über Attribute
-            col_list = getattr(expected_columns_model, section, [])
-            expected_columns.update(col.name for col in col_list)
-        missing_columns = expected_columns - set(df.columns)
+        missing_columns = self.config.get_expected_column_names().difference(df.columns)
         if missing_columns:
             missing_str = "\n".join(sorted(missing_columns))
             logger.warning(f"Fehlende Spalten: {missing_str}")
@@ -1,6 +1,6 @@
 import subprocess
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import pandas as pd
 from loguru import logger
@@ -8,19 +8,31 @@ from openpyxl.formatting.rule import FormulaRule
 from openpyxl.styles import Font, PatternFill
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.table import Table, TableStyleInfo
-from PyPDF2 import PdfMerger
+from openpyxl.worksheet.worksheet import Worksheet
+from PyPDF2 import PdfWriter
 
 from shared_modules.config import Config
 
 from .invoice_context import InvoiceContext
 
 
-def _summary_column_letter(summary_df: pd.DataFrame, column_name: str) -> str:
-    """Gibt den Excel-Spaltenbuchstaben für eine eindeutige Übersichts-Spalte zurück."""
+def _summary_column_index(summary_df: pd.DataFrame, column_name: str) -> int:
+    """Gibt den 1-basierten Excel-Spaltenindex für eine eindeutige Übersichts-Spalte zurück."""
     loc = summary_df.columns.get_loc(column_name)
     if not isinstance(loc, int):
         raise ValueError(f"Spalte '{column_name}' ist in der Rechnungsübersicht nicht eindeutig.")
-    return get_column_letter(loc + 1)
+    return loc + 1
+
+
+def _summary_column_letter(summary_df: pd.DataFrame, column_name: str) -> str:
+    """Gibt den Excel-Spaltenbuchstaben für eine eindeutige Übersichts-Spalte zurück."""
+    return get_column_letter(_summary_column_index(summary_df, column_name))
+
+
+def _set_column_format(worksheet: Worksheet, col_idx: int, first_row: int, last_row: int, number_format: str) -> None:
+    """Setzt das Zahlenformat eines Spaltenbereichs in einem Durchlauf über die Zellobjekte."""
+    for (cell,) in worksheet.iter_rows(min_row=first_row, max_row=last_row, min_col=col_idx, max_col=col_idx):
+        cell.number_format = number_format
 
 
 class DocumentUtils:
@@ -33,49 +45,60 @@ class DocumentUtils:
     """
 
     @staticmethod
-    def docx_to_pdf(docx_path: Path, pdf_path: Path, invoice_context: InvoiceContext) -> Path:
+    def docx_batch_to_pdf(
+        docx_paths: List[Path],
+        profile_dir: Optional[Path] = None,
+    ) -> Dict[Path, Optional[Path]]:
         """
-        Konvertiert eine DOCX-Datei in eine PDF-Datei mit LibreOffice und benennt sie ggf. nach Vorgabe um.
+        Konvertiert mehrere DOCX-Dateien mit einem einzigen LibreOffice-Aufruf nach PDF.
+        Die PDFs entstehen neben den DOCX-Dateien (gleicher Dateiname, Endung .pdf).
+        Der Start von LibreOffice fällt so nur einmal pro Stapel statt pro Datei an.
 
         Args:
-            docx_path (Path): Pfad zur DOCX-Datei.
-            pdf_path (Path): Pfad zur Ausgabedatei (PDF).
-            invoice_context (InvoiceContext): Kontextobjekt mit allen Rechnungsdaten.
+            docx_paths (List[Path]): DOCX-Dateien, alle im selben Verzeichnis.
+            profile_dir (Optional[Path]): Eigenes LibreOffice-Benutzerprofil. Nötig, wenn mehrere
+                Konvertierungen gleichzeitig laufen, da sich Instanzen mit gleichem Profil sperren.
         Returns:
-            Path: Pfad zur erzeugten PDF-Datei.
+            Dict[Path, Optional[Path]]: PDF-Pfad je DOCX-Pfad, None wenn keine PDF entstanden ist.
         Raises:
-            RuntimeError: Wenn die Konvertierung oder Umbenennung fehlschlägt.
+            ValueError: Wenn die DOCX-Dateien in verschiedenen Verzeichnissen liegen.
         """
+        if not docx_paths:
+            return {}
+        out_dirs = {docx_path.parent for docx_path in docx_paths}
+        if len(out_dirs) != 1:
+            raise ValueError("Stapel-Konvertierung erwartet alle DOCX-Dateien im selben Verzeichnis.")
+        out_dir = out_dirs.pop()
+
+        # Alte PDFs entfernen, damit nur tatsächlich neu erzeugte Dateien als Erfolg zählen
+        for docx_path in docx_paths:
+            docx_path.with_suffix(".pdf").unlink(missing_ok=True)
+
+        command = ["libreoffice", "--headless"]
+        if profile_dir is not None:
+            command.append(f"-env:UserInstallation={profile_dir.resolve().as_uri()}")
+        command += ["--convert-to", "pdf", "--outdir", str(out_dir), *(str(p) for p in docx_paths)]
         try:
             subprocess.run(
-                [
-                    "libreoffice",
-                    "--headless",
-                    "--convert-to",
-                    "pdf",
-                    "--outdir",
-                    str(pdf_path.parent),
-                    str(docx_path),
-                ],
+                command,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
                 check=True,
             )
         except Exception as e:
-            logger.error(f"PDF-Konvertierung fehlgeschlagen: {e}")
-            raise RuntimeError(f"PDF-Konvertierung fehlgeschlagen: {e}")
+            # Teilweise erzeugte PDFs bleiben gültig; fehlende werden unten einzeln gemeldet.
+            logger.error(f"PDF-Stapelkonvertierung fehlgeschlagen: {e}")
 
-        _ = invoice_context
-        generated_pdf = docx_path.with_suffix(".pdf")
-        target_pdf = pdf_path
-        try:
-            if generated_pdf.resolve() != target_pdf.resolve():
-                generated_pdf.replace(target_pdf)
-        except Exception as e:
-            logger.error(f"PDF konnte nicht umbenannt werden: {e}")
-            raise RuntimeError(f"PDF konnte nicht umbenannt werden: {e}")
-        logger.debug(f"{target_pdf.name} erzeugt")
-        return target_pdf
+        results: Dict[Path, Optional[Path]] = {}
+        for docx_path in docx_paths:
+            pdf_path = docx_path.with_suffix(".pdf")
+            if pdf_path.exists():
+                logger.debug(f"{pdf_path.name} erzeugt")
+                results[docx_path] = pdf_path
+            else:
+                logger.error(f"PDF-Konvertierung fehlgeschlagen: {pdf_path.name} wurde nicht erzeugt")
+                results[docx_path] = None
+        return results
 
     @staticmethod
     def merge_pdfs(pdf_files: List[Path], payer_context: InvoiceContext, output_path: Optional[Path] = None) -> Path:
@@ -95,11 +118,12 @@ class DocumentUtils:
         """
         if not pdf_files:
             raise ValueError("Keine PDF-Dateien zum Zusammenführen gefunden.")
-        merger = PdfMerger()
+        # PdfWriter.append übernimmt die Seitenobjekte direkt (Nachfolger des veralteten PdfMerger)
+        writer = PdfWriter()
         for pdf_file in pdf_files:
             if not pdf_file.exists():
                 raise FileNotFoundError(f"PDF-Datei nicht gefunden: {pdf_file}")
-            merger.append(pdf_file)
+            writer.append(pdf_file)
         # Zielverzeichnis bestimmen
         if output_path is None:
             output_path = pdf_files[0].parent
@@ -108,8 +132,8 @@ class DocumentUtils:
         payer_id = getattr(payer, "key", "n.a") if payer else "n.a"
         merged_pdf_path = output_path / f"Rechnungen_{payer_id}_{invoice_month}.pdf"
         try:
-            merger.write(merged_pdf_path)
-            merger.close()
+            with merged_pdf_path.open("wb") as merged_file:
+                writer.write(merged_file)
         except Exception as e:
             logger.error(f"PDF-Zusammenführung fehlgeschlagen: {e}")
             raise RuntimeError(f"PDF-Zusammenführung fehlgeschlagen: {e}")
@@ -206,8 +230,13 @@ class DocumentUtils:
                 # Währungsspalte formatieren und summieren
                 if "Rechnungsbetrag" in summary_df.columns:
                     kosten_col_letter = _summary_column_letter(summary_df, "Rechnungsbetrag")
-                    for row in range(2, len(summary_df) + 2):
-                        worksheet[f"{kosten_col_letter}{row}"].number_format = kosten_format
+                    _set_column_format(
+                        worksheet,
+                        _summary_column_index(summary_df, "Rechnungsbetrag"),
+                        2,
+                        len(summary_df) + 1,
+                        kosten_format,
+                    )
                     worksheet[f"{kosten_col_letter}{total_row_idx}"] = (
                         f"=SUM({kosten_col_letter}2:{kosten_col_letter}{total_row_idx - 1})"
                     )
@@ -227,8 +256,9 @@ class DocumentUtils:
                 for col_name in int_min_cols:
                     if col_name in summary_df.columns:
                         col_letter = _summary_column_letter(summary_df, col_name)
-                        for row in range(2, len(summary_df) + 2):
-                            worksheet[f"{col_letter}{row}"].number_format = "0"
+                        _set_column_format(
+                            worksheet, _summary_column_index(summary_df, col_name), 2, len(summary_df) + 1, "0"
+                        )
                         worksheet[f"{col_letter}{total_row_idx}"] = (
                             f"=SUM({col_letter}2:{col_letter}{total_row_idx - 1})"
                         )
@@ -253,9 +283,13 @@ class DocumentUtils:
 
                 # Datumsspalte formatieren
                 if "Rechnungsdatum" in summary_df.columns:
-                    datum_col_letter = _summary_column_letter(summary_df, "Rechnungsdatum")
-                    for row in range(2, len(summary_df) + 2):
-                        worksheet[f"{datum_col_letter}{row}"].number_format = datum_format
+                    _set_column_format(
+                        worksheet,
+                        _summary_column_index(summary_df, "Rechnungsdatum"),
+                        2,
+                        len(summary_df) + 1,
+                        datum_format,
+                    )
         except Exception as e:
             logger.error(f"Fehler beim Schreiben der Excel-Datei: {e}")
             raise RuntimeError(f"Fehler beim Schreiben der Excel-Datei: {e}")
@@ -1,11 +1,12 @@
-from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Dict, MutableMapping, Optional, Tuple, Type, Union
 
 from babel.dates import format_date
 from babel.numbers import format_currency, format_decimal
-from jinja2 import Environment, Undefined
+from jinja2 import Environment, Template, Undefined, nodes
 from pydantic import BaseModel
 
+from shared_modules.utils import parse_ch_date
+
 
 class FilterConfig(BaseModel):
     """
@@ -65,13 +66,47 @@ def babel_date(value: Any, locale: str = "de_CH", date_format: Optional[str] = N
     if value is None:
         return ""
     if isinstance(value, str):
-        try:
-            value = datetime.strptime(value, "%d.%m.%Y").date()
-        except Exception:
-            return str(value)  # Fallback: gib den String zurück
+        parsed = parse_ch_date(value)
+        if parsed is None:
+            # Nur TT.MM.JJJJ mit vierstelligem Jahr; Kurzformen wie 1.1.26 ergäben sonst das Jahr 0026
+            return value
+        value = parsed
     return format_date(value, format=date_format or "medium", locale=locale)
 
 
+class TemplateCacheEnvironment(Environment):
+    """
+    Jinja2-Environment, das aus Strings kompilierte Templates wiederverwendet.
+    docxtpl kompiliert bei jedem render() alle XML-Teile der Vorlage über from_string() neu;
+    bei gleicher Vorlage ist der Quelltext identisch, das kompilierte Template also wiederverwendbar.
+    """
+
+    # Obergrenze gegen unbeschränktes Wachstum bei wechselnden Vorlagen
+    _MAX_CACHED_TEMPLATES = 64
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._string_templates: Dict[Tuple[str, Any], Template] = {}
+
+    def from_string(
+        self,
+        source: Union[str, nodes.Template],
+        globals: Optional[MutableMapping[str, Any]] = None,
+        template_class: Optional[Type[Template]] = None,
+    ) -> Template:
+        if not isinstance(source, str) or globals is not None or template_class is not None:
+            return super().from_string(source, globals, template_class)
+        # autoescape fliesst in die Kompilierung ein (docxtpl setzt es pro render())
+        key = (source, self.autoescape)
+        template = self._string_templates.get(key)
+        if template is None:
+            if len(self._string_templates) >= self._MAX_CACHED_TEMPLATES:
+                self._string_templates.clear()
+            template = super().from_string(source)
+            self._string_templates[key] = template
+        return template
+
+
 def register_filters(env: Environment, config: FilterConfig) -> None:
     """
     Registriert alle Babel-Filter im Jinja2-Environment.
@@ -1,7 +1,8 @@
 import re
-import tempfile
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
 
 import qrcode
 from babel.numbers import format_decimal
@@ -18,6 +19,90 @@ from shared_modules.utils import (
 
 from .invoice_context import InvoiceContext
 
+_Font = ImageFont.FreeTypeFont | ImageFont.ImageFont
+
+# Layout des Einzahlungsscheins (Pixel)
+_SLIP_SIZE = (1800, 900)
+_SLIP_DIVIDER_X = 600
+_SLIP_TITLE_Y = 100
+_SLIP_TEXT_Y = _SLIP_TITLE_Y + 60
+_SLIP_RECEIPT_X = 80
+_SLIP_QR_SIZE = 418
+_SLIP_QR_X = _SLIP_DIVIDER_X + 40
+_SLIP_QR_Y = (_SLIP_SIZE[1] - _SLIP_QR_SIZE) // 2
+_SLIP_PAYMENT_X = _SLIP_QR_X + _SLIP_QR_SIZE + 40
+_SLIP_PAYMENT_AMOUNT_Y = _SLIP_QR_Y + _SLIP_QR_SIZE + 20
+_SLIP_AMOUNT_COL_GAP = 180
+_SLIP_AMOUNT_ROW_GAP = 32
+
+# Feldbezeichnungen je Zeile; leere Bezeichnung = Folgezeile ohne eigene Überschrift
+_SLIP_RECEIPT_LABELS = ("Konto / Zahlbar an", "", "", "", "Zahlbar durch", "", "")
+_SLIP_PAYMENT_LABELS = (
+    "Konto / Zahlbar an",
+    "",
+    "",
+    "",
+    "Zusätzliche Informationen",
+    "Zahlbar durch",
+    "",
+    "",
+)
+
+
+@lru_cache(maxsize=8)
+def _load_slip_fonts(font_dir: str) -> Tuple[_Font, _Font, _Font]:
+    """
+    Lädt die Schriften des Einzahlungsscheins einmal pro Prozess und Schriftverzeichnis.
+    Reihenfolge: Calibri aus font_dir, Calibri (Windows/WSL), Liberation Sans, DejaVu Sans,
+    zuletzt die Pillow-Standardschrift.
+    Returns:
+        Tuple[_Font, _Font, _Font]: Schrift für Werte (36), Überschriften (48), Bezeichnungen (28).
+    """
+    font_candidates = [
+        (str(Path(font_dir) / "calibri.ttf"), str(Path(font_dir) / "calibrib.ttf")),
+        ("/mnt/c/Windows/Fonts/calibri.ttf", "/mnt/c/Windows/Fonts/calibrib.ttf"),
+        (
+            "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
+            "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
+        ),
+        (
+            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+        ),
+    ]
+    for regular, bold in font_candidates:
+        try:
+            return (
+                ImageFont.truetype(regular, 36),
+                ImageFont.truetype(bold, 48),
+                ImageFont.truetype(bold, 28),
+            )
+        except Exception:
+            continue
+    default_font = ImageFont.load_default()
+    return default_font, default_font, default_font
+
+
+def _slip_text_layout(
+    x: int, y: int, labels: Tuple[str, ...]
+) -> Tuple[List[Tuple[Optional[Tuple[int, int]], Tuple[int, int]]], int]:
+    """
+    Berechnet die Positionen eines Textblocks im Einzahlungsschein.
+    Returns:
+        Tuple: Je Zeile (Position der Bezeichnung oder None, Position des Werts) sowie die
+        y-Position des anschliessenden Betragsblocks.
+    """
+    rows: List[Tuple[Optional[Tuple[int, int]], Tuple[int, int]]] = []
+    for label in labels:
+        label_pos: Optional[Tuple[int, int]] = None
+        if label:
+            y += 10
+            label_pos = (x, y)
+            y += 30
+        rows.append((label_pos, (x, y)))
+        y += 40
+    return rows, y + 10
+
 
 def generate_scor(invoice_number: str) -> str:
     """
@@ -62,6 +147,28 @@ class InvoiceFactory:
             zip_city=f"{provider_cfg.zip_code} {provider_cfg.city}",
             iban=safe_str(provider_cfg.iban),
         )
+        # Rohbytes der Rechnungsvorlage (Pfad, Inhalt); einmal pro Lauf von der Platte gelesen
+        self._template_cache: Optional[Tuple[Path, bytes]] = None
+        # Statischer Hintergrund des Einzahlungsscheins samt Schriften, je Schriftverzeichnis
+        self._slip_cache: Dict[str, Tuple[Image.Image, _Font, _Font]] = {}
+
+    def _load_template_bytes(self) -> bytes:
+        """
+        Liefert die Rechnungsvorlage als Bytes und liest sie nur beim ersten Aufruf von der Platte.
+        DocxTemplate verändert sich beim Rendern, deshalb wird pro Rechnung ein neues Objekt
+        aus diesen Bytes erzeugt statt dasselbe Objekt wiederzuverwenden.
+        Returns:
+            bytes: Inhalt der DOCX-Vorlage.
+        Raises:
+            FileNotFoundError: Wenn die Vorlage nicht existiert.
+        """
+        template_name = self.config.templates.invoice_template_name or "rechnungsvorlage.docx"
+        template_path = self.config.get_template_path(template_name)
+        if self._template_cache is None or self._template_cache[0] != template_path:
+            if not template_path.exists():
+                raise FileNotFoundError(f"Template nicht gefunden: {template_path}")
+            self._template_cache = (template_path, template_path.read_bytes())
+        return self._template_cache[1]
 
     def create_invoice_id(self, client_id: str, invoice_month: str) -> str:
         """
@@ -79,42 +186,24 @@ class InvoiceFactory:
     def create_payment_part_png(
         self,
         invoice_context: InvoiceContext,
-        output_png: str,
+        output_png: Union[str, Path, BinaryIO],
         font_dir: str = "/usr/share/fonts/truetype/msttcorefonts/",
     ) -> None:
         """
         Erstellt einen Einzahlungsschein als PNG mit QR-Code.
         Nutzt ausschließlich typisierte Entity- und Kontextdaten.
+        Linien, Überschriften und Feldbezeichnungen stammen aus einem einmal gezeichneten
+        Hintergrund; pro Rechnung werden nur die Werte und der QR-Code ergänzt.
         Args:
             invoice_context (InvoiceContext): Kontext mit Rechnungsdaten.
-            output_png (str): Zielpfad für das PNG.
+            output_png (Union[str, Path, BinaryIO]): Zielpfad oder beschreibbarer Binärpuffer für das PNG.
             font_dir (str): Verzeichnis mit Schriftarten.
         """
-        Path(output_png).parent.mkdir(parents=True, exist_ok=True)
-        width, height = 1800, 900
-        img = Image.new("RGB", (width, height), "white")
+        if isinstance(output_png, (str, Path)):
+            Path(output_png).parent.mkdir(parents=True, exist_ok=True)
+        background, font, font_small_bold = self._slip_background(font_dir)
+        img = background.copy()
         draw = ImageDraw.Draw(img)
-        _FONT_CANDIDATES = [
-            (str(Path(font_dir) / "calibri.ttf"), str(Path(font_dir) / "calibrib.ttf")),
-            ("/mnt/c/Windows/Fonts/calibri.ttf", "/mnt/c/Windows/Fonts/calibrib.ttf"),
-            (
-                "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
-                "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
-            ),
-            (
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-            ),
-        ]
-        font = font_bold = font_small_bold = ImageFont.load_default()
-        for _regular, _bold in _FONT_CANDIDATES:
-            try:
-                font = ImageFont.truetype(_regular, 36)
-                font_bold = ImageFont.truetype(_bold, 48)
-                font_small_bold = ImageFont.truetype(_bold, 28)
-                break
-            except Exception:
-                continue
 
         # Tenant-Daten bevorzugen (klientenspezifisch), Fallback auf globalen Service Provider
         payer = invoice_context.data.get("payer")
@@ -147,57 +236,35 @@ class InvoiceFactory:
         total_amount = invoice_context.data.get("summe_kosten", None)
         total_display = self._format_amount_display(total_amount)
 
-        # Linien
-        divider_x = 600
-        draw.line([(divider_x, 60), (divider_x, height - 60)], fill="black", width=3)
-        draw.line([(60, 60), (width - 60, 60)], fill="black", width=2)
-
         # Linker Bereich: Empfangsschein
-        x1, y1 = 80, 100
-        draw.text((x1, y1), "Empfangsschein", font=font_bold, fill="black")
-        y1 += 60
-        for label, value in [
-            ("Konto / Zahlbar an", provider_iban),
-            ("", provider_name),
-            ("", provider_street),
-            ("", provider_zip_city),
-            ("Zahlbar durch", payer_name),
-            ("", payer_street),
-            ("", payer_zip_city),
-        ]:
-            if label:
-                y1 += 10
-                draw.text((x1, y1), label, font=font_small_bold, fill="black")
-                y1 += 30
-            draw.text((x1, y1), safe_str(value), font=font, fill="black")
-            y1 += 40
-
-        y1 += 10
-        self._draw_amount_block(draw, x1, y1, currency, total_display, font_small_bold, font)
+        receipt_values = [
+            provider_iban,
+            provider_name,
+            provider_street,
+            provider_zip_city,
+            payer_name,
+            payer_street,
+            payer_zip_city,
+        ]
+        receipt_rows, receipt_amount_y = _slip_text_layout(_SLIP_RECEIPT_X, _SLIP_TEXT_Y, _SLIP_RECEIPT_LABELS)
+        for (_, value_pos), value in zip(receipt_rows, receipt_values):
+            draw.text(value_pos, safe_str(value), font=font, fill="black")
+        self._draw_amount_values(draw, _SLIP_RECEIPT_X, receipt_amount_y, currency, total_display, font)
 
         # Rechter Bereich: Zahlteil (QR links, Textblock rechts)
-        qr_size = 418
-        qr_x = divider_x + 40
-        qr_y = (height - qr_size) // 2
-        x2, y2 = qr_x + qr_size + 40, 100
-        draw.text((qr_x, 100), "Zahlteil", font=font_bold, fill="black")
-        y2 += 60
-        for label, value in [
-            ("Konto / Zahlbar an", provider_iban),
-            ("", provider_name),
-            ("", provider_street),
-            ("", provider_zip_city),
-            ("Zusätzliche Informationen", invoice_id),
-            ("Zahlbar durch", payer_name),
-            ("", payer_street),
-            ("", payer_zip_city),
-        ]:
-            if label:
-                y2 += 10
-                draw.text((x2, y2), label, font=font_small_bold, fill="black")
-                y2 += 30
-            draw.text((x2, y2), safe_str(value), font=font, fill="black")
-            y2 += 40
+        payment_values = [
+            provider_iban,
+            provider_name,
+            provider_street,
+            provider_zip_city,
+            invoice_id,
+            payer_name,
+            payer_street,
+            payer_zip_city,
+        ]
+        payment_rows, _ = _slip_text_layout(_SLIP_PAYMENT_X, _SLIP_TEXT_Y, _SLIP_PAYMENT_LABELS)
+        for (_, value_pos), value in zip(payment_rows, payment_values):
+            draw.text(value_pos, safe_str(value), font=font, fill="black")
 
         # QR-Code-Daten aus Kontext
         qr_data = self._build_spc_payload(
@@ -215,12 +282,60 @@ class InvoiceFactory:
             additional_info=invoice_id,
         )
         qr_img = qrcode.make(qr_data)
-        # qrcode mit PIL-Backend gibt ein PIL.Image zurück
-        qr_img = qr_img.get_image().convert("RGB").resize((qr_size, qr_size))  # type: ignore[union-attr]
-        img.paste(qr_img, (qr_x, qr_y))
-        amount_y = qr_y + qr_size + 20
-        self._draw_amount_block(draw, qr_x, amount_y, currency, total_display, font_small_bold, font)
-        img.save(output_png)
+        # qrcode mit PIL-Backend gibt ein 1-Bit-PIL.Image zurück. Skaliert wird vor der
+        # RGB-Konvertierung und mit NEAREST: QR-Module sind rein schwarz/weiss, Interpolation
+        # erzeugt nur graue Kanten und kostet ein Vielfaches.
+        qr_img = (
+            qr_img.get_image()  # type: ignore[union-attr]
+            .resize((_SLIP_QR_SIZE, _SLIP_QR_SIZE), Image.Resampling.NEAREST)
+            .convert("RGB")
+        )
+        img.paste(qr_img, (_SLIP_QR_X, _SLIP_QR_Y))
+        self._draw_amount_values(draw, _SLIP_QR_X, _SLIP_PAYMENT_AMOUNT_Y, currency, total_display, font)
+        # Schnellste zlib-Stufe: Das Bild wird direkt ins DOCX eingebettet und nicht archiviert
+        img.save(output_png, format="PNG", compress_level=1)
+
+    def _slip_background(self, font_dir: str) -> Tuple[Image.Image, _Font, _Font]:
+        """
+        Liefert den statischen Teil des Einzahlungsscheins (Linien, Überschriften, Feldbezeichnungen)
+        samt Schriften für die Werte. Wird pro Schriftverzeichnis einmal gezeichnet und danach
+        nur noch kopiert.
+        Args:
+            font_dir (str): Verzeichnis mit Schriftarten.
+        Returns:
+            Tuple[Image.Image, _Font, _Font]: Hintergrund, Schrift für Werte, Schrift für Bezeichnungen.
+        """
+        cached = self._slip_cache.get(font_dir)
+        if cached is not None:
+            return cached
+
+        width, height = _SLIP_SIZE
+        img = Image.new("RGB", (width, height), "white")
+        draw = ImageDraw.Draw(img)
+        font, font_bold, font_small_bold = _load_slip_fonts(font_dir)
+
+        # Linien
+        draw.line([(_SLIP_DIVIDER_X, 60), (_SLIP_DIVIDER_X, height - 60)], fill="black", width=3)
+        draw.line([(60, 60), (width - 60, 60)], fill="black", width=2)
+
+        # Linker Bereich: Empfangsschein
+        draw.text((_SLIP_RECEIPT_X, _SLIP_TITLE_Y), "Empfangsschein", font=font_bold, fill="black")
+        receipt_rows, receipt_amount_y = _slip_text_layout(_SLIP_RECEIPT_X, _SLIP_TEXT_Y, _SLIP_RECEIPT_LABELS)
+        for label, (label_pos, _) in zip(_SLIP_RECEIPT_LABELS, receipt_rows):
+            if label_pos is not None:
+                draw.text(label_pos, label, font=font_small_bold, fill="black")
+        self._draw_amount_labels(draw, _SLIP_RECEIPT_X, receipt_amount_y, font_small_bold)
+
+        # Rechter Bereich: Zahlteil
+        draw.text((_SLIP_QR_X, _SLIP_TITLE_Y), "Zahlteil", font=font_bold, fill="black")
+        payment_rows, _ = _slip_text_layout(_SLIP_PAYMENT_X, _SLIP_TEXT_Y, _SLIP_PAYMENT_LABELS)
+        for label, (label_pos, _) in zip(_SLIP_PAYMENT_LABELS, payment_rows):
+            if label_pos is not None:
+                draw.text(label_pos, label, font=font_small_bold, fill="black")
+        self._draw_amount_labels(draw, _SLIP_QR_X, _SLIP_PAYMENT_AMOUNT_Y, font_small_bold)
+
+        self._slip_cache[font_dir] = (img, font, font_small_bold)
+        return self._slip_cache[font_dir]
 
     @staticmethod
     def _split_street(street: str) -> Tuple[str, str]:
@@ -253,21 +368,22 @@ class InvoiceFactory:
             return self._format_amount(amount)
 
     @staticmethod
-    def _draw_amount_block(
+    def _draw_amount_labels(draw: ImageDraw.ImageDraw, x: int, y: int, font_label: _Font) -> None:
+        draw.text((x, y), "Währung", font=font_label, fill="black")
+        draw.text((x + _SLIP_AMOUNT_COL_GAP, y), "Betrag", font=font_label, fill="black")
+
+    @staticmethod
+    def _draw_amount_values(
         draw: ImageDraw.ImageDraw,
         x: int,
         y: int,
         currency: str,
         amount: str,
-        font_label: ImageFont.FreeTypeFont | ImageFont.ImageFont,
-        font_value: ImageFont.FreeTypeFont | ImageFont.ImageFont,
+        font_value: _Font,
     ) -> None:
-        col_gap = 180
-        draw.text((x, y), "Währung", font=font_label, fill="black")
-        draw.text((x + col_gap, y), "Betrag", font=font_label, fill="black")
-        y += 32
+        y += _SLIP_AMOUNT_ROW_GAP
         draw.text((x, y), safe_str(currency), font=font_value, fill="black")
-        draw.text((x + col_gap, y), safe_str(amount), font=font_value, fill="black")
+        draw.text((x + _SLIP_AMOUNT_COL_GAP, y), safe_str(amount), font=font_value, fill="black")
 
     def _address_lines_structured(self, name: str, street: str, zip_code: str, city: str) -> List[str]:
         if not name:
@@ -345,32 +461,26 @@ class InvoiceFactory:
         Returns:
             DocxTemplate: Gerendertes Dokument.
         """
-        # Zugriff auf Pfade und Template-Namen über typisierte Pydantic-Konfiguration
-        template_name = self.config.templates.invoice_template_name or "rechnungsvorlage.docx"
-        template_path = self.config.get_template_path(template_name)
-        if not template_path.exists():
-            raise FileNotFoundError(f"Template nicht gefunden: {template_path}")
-
-        invoice_template = DocxTemplate(template_path)
-
-        # Einzahlungsschein-Bild erzeugen, temporär speichern
-        tmp_dir = self.config.get_tmp_path()
-        tmp_dir.mkdir(parents=True, exist_ok=True)
-        with tempfile.NamedTemporaryFile(dir=tmp_dir, suffix=".png", delete=True) as tmp_file:
-            self.create_payment_part_png(invoice_context, tmp_file.name)
-            payment_part_img = InlineImage(invoice_template, tmp_file.name, width=Mm(200))
-            invoice_context["payment_part"] = payment_part_img
-
-            # Optional: Template- und Kontext-Felder vergleichen (Debug)
-            # template_fields = invoice_template.get_undeclared_template_variables(jinja_env=jinja_env)
-            # print('Template (ist):\n', template_fields)
-            # context_fields = list(invoice_context.as_dict().keys())
-            # print('Kontext (Soll)\n', context_fields)
-            # print('Positionen-Felder:')
-            # print(invoice_context["positions"][0] if invoice_context["positions"] else "Keine Positionen")
-            # exit(0)
-
-            invoice_template.render(invoice_context.as_dict(), jinja_env=jinja_env)
+        # Vorlage aus dem Byte-Cache: kein erneuter Plattenzugriff pro Rechnung
+        invoice_template = DocxTemplate(BytesIO(self._load_template_bytes()))
+
+        # Einzahlungsschein-Bild im Speicher erzeugen (kein Umweg über eine temporäre Datei)
+        payment_part_png = BytesIO()
+        self.create_payment_part_png(invoice_context, payment_part_png)
+        payment_part_png.seek(0)
+        payment_part_img = InlineImage(invoice_template, payment_part_png, width=Mm(200))
+        invoice_context["payment_part"] = payment_part_img
+
+        # Optional: Template- und Kontext-Felder vergleichen (Debug)
+        # template_fields = invoice_template.get_undeclared_template_variables(jinja_env=jinja_env)
+        # print('Template (ist):\n', template_fields)
+        # context_fields = list(invoice_context.as_dict().keys())
+        # print('Kontext (Soll)\n', context_fields)
+        # print('Positionen-Felder:')
+        # print(invoice_context["positions"][0] if invoice_context["positions"] else "Keine Positionen")
+        # exit(0)
+
+        invoice_template.render(invoice_context.as_dict(), jinja_env=jinja_env)
 
         return invoice_template
 
@@ -1,11 +1,13 @@
 import math
+import os
 import sqlite3
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
-from zipfile import ZipFile
+from typing import Dict, List, Optional, Tuple
+from zipfile import ZIP_STORED, ZipFile
 
 import pandas as pd
-from jinja2 import Environment
 from loguru import logger
 from pandas._typing import Scalar
 
@@ -14,6 +16,7 @@ from shared_modules.entity import LegalPerson, PrivatePerson
 from shared_modules.month_period import MonthPeriod, get_month_period
 from shared_modules.utils import (
     clear_path,
+    ensure_dir,
     log_exceptions,
     safe_str,
     to_float,
@@ -21,7 +24,7 @@ from shared_modules.utils import (
 )
 
 from .document_utils import DocumentUtils
-from .filters import FilterConfig, register_filters
+from .filters import FilterConfig, TemplateCacheEnvironment, register_filters
 from .invoice_context import InvoiceContext
 from .invoice_factory import InvoiceFactory
 from .invoice_filter import InvoiceFilter
@@ -30,6 +33,12 @@ from .invoice_filter import InvoiceFilter
 _PRIVATE_SERVICE_TYPE_CODE = "ST99"
 _INTRO_FREE_MINUTES = 15
 
+# Anzahl paralleler LibreOffice-Konvertierungen (jeweils mit eigenem Profil)
+_PDF_WORKERS = max(1, min(4, os.cpu_count() or 1))
+
+# (DOCX-Pfad, Rechnungskontext) einer gerenderten Rechnung
+_InvoiceJob = Tuple[Path, InvoiceContext]
+
 
 class InvoiceProcessor:
     """
@@ -77,6 +86,37 @@ class InvoiceProcessor:
         rounded = math.ceil((minutes_raw / step) - epsilon) * step
         return int(round(rounded))
 
+    def _convert_invoices_to_pdf(self, jobs: List[_InvoiceJob], tmp_path: Path) -> Dict[Path, Optional[Path]]:
+        """
+        Konvertiert die gerenderten Rechnungs-DOCX parallel nach PDF.
+        Die Rechnungen werden auf höchstens _PDF_WORKERS Stapel verteilt; jeder Stapel wird mit
+        einem einzigen LibreOffice-Aufruf und eigenem Profil konvertiert (keine Single-Instance-Sperre).
+        Die Arbeit läuft in LibreOffice-Subprozessen, daher genügen Threads.
+        Args:
+            jobs (List[_InvoiceJob]): DOCX-Pfade mit zugehörigem Rechnungskontext.
+            tmp_path (Path): Temporäres Verzeichnis für die LibreOffice-Profile.
+        Returns:
+            Dict[Path, Optional[Path]]: PDF-Pfad je DOCX-Pfad, None bei fehlgeschlagener Konvertierung.
+        """
+        if not jobs:
+            return {}
+        workers = min(_PDF_WORKERS, len(jobs))
+        docx_paths = [docx_path for docx_path, _ in jobs]
+        batches = [docx_paths[idx::workers] for idx in range(workers)]
+
+        logger.debug(f"Konvertiere {len(jobs)} Rechnungen in {workers} LibreOffice-Stapeln.")
+        pdf_by_docx: Dict[Path, Optional[Path]] = {}
+        # Profile nur für diesen Konvertierungslauf; clear_path entfernt keine Verzeichnisse,
+        # daher werden die vollständigen LibreOffice-Profile hier selbst wieder gelöscht
+        with tempfile.TemporaryDirectory(
+            prefix="lo_profiles_", dir=tmp_path, ignore_cleanup_errors=True
+        ) as profile_root:
+            profiles = [ensure_dir(Path(profile_root) / f"worker_{idx}") for idx in range(workers)]
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for batch_result in executor.map(DocumentUtils.docx_batch_to_pdf, batches, profiles):
+                    pdf_by_docx.update(batch_result)
+        return pdf_by_docx
+
     def _load_service_data(self, period: MonthPeriod) -> pd.DataFrame:
         """
         Lädt service_data aus der SQLite-DB und reichert sie mit Stammdaten an.
@@ -252,6 +292,8 @@ class InvoiceProcessor:
         invoice_list: List[InvoiceContext] = []
         all_invoices: List[Path] = []
         all_docx: List[Path] = []
+        # Pro Kostenträger: Kontext und gerenderte Rechnungen; die PDF-Konvertierung folgt gesammelt
+        payer_jobs: List[Tuple[Scalar, InvoiceContext, List[_InvoiceJob]]] = []
 
         # Jinja2-Environment mit typisierter Filter-Konfiguration initialisieren
         formatting = self.config.formatting
@@ -262,7 +304,8 @@ class InvoiceProcessor:
             date_format=formatting.date_format or "dd.MM.yyyy",
             numeric_format=formatting.numeric_format or "#,##0.00",
         )
-        jinja_env = Environment()
+        # Kompilierte Vorlagen-XML wird über alle Rechnungen des Laufs wiederverwendet
+        jinja_env = TemplateCacheEnvironment()
         register_filters(jinja_env, filter_config)
 
         # Gruppierung nach Zahlungsdienstleister (ZDNR)
@@ -272,7 +315,7 @@ class InvoiceProcessor:
                 continue
             payer_row = payer_data.iloc[0]
 
-            invoices_for_payer: List[Path] = []
+            jobs_for_payer: List[_InvoiceJob] = []
 
             # LegalPerson wird mit typisierten Feldern aus der DataFrame-Zeile erstellt
             payer_obj = LegalPerson(
@@ -366,20 +409,23 @@ class InvoiceProcessor:
                 # Zeilen aufteilen: «ohne Berechnung»-Einträge (Notiz, case-insensitiv) bleiben
                 # als eigene Rechnungsposition erhalten; alle anderen werden je Tag summiert.
                 details_sorted = client_details.sort_values("service_date")  # pyright: ignore[reportCallIssue]
-                is_intro_mask = details_sorted["notes"].apply(lambda v: "ohne berechnung" in str(v or "").lower())
+                is_intro_mask = (
+                    details_sorted["notes"]
+                    .fillna("")
+                    .astype(str)
+                    .str.lower()
+                    .str.contains("ohne berechnung", regex=False)
+                )
                 intro_rows = details_sorted[is_intro_mask]
                 normal_rows = details_sorted[~is_intro_mask]
 
-                date_groups = (
-                    normal_rows.groupby("service_date", as_index=False)
-                    .agg(
-                        travel_time=("travel_time", "sum"),
-                        direct_time=("direct_time", "sum"),
-                        indirect_time=("indirect_time", "sum"),
-                        hourly_rate=("hourly_rate", "first"),
-                        rundung=("rundung", "first"),
-                    )
-                    .sort_values("service_date")  # pyright: ignore[reportCallIssue]
+                # Ein Aggregationsdurchlauf je Klient; groupby liefert die Tage bereits sortiert
+                date_groups = normal_rows.groupby("service_date", as_index=False).agg(
+                    travel_time=("travel_time", "sum"),
+                    direct_time=("direct_time", "sum"),
+                    indirect_time=("indirect_time", "sum"),
+                    hourly_rate=("hourly_rate", "first"),
+                    rundung=("rundung", "first"),
                 )
 
                 has_intro_position = False
@@ -406,14 +452,15 @@ class InvoiceProcessor:
                     }
 
                 # «ohne Berechnung»-Positionen als separate Zeilen (nicht aggregiert, Kosten=0)
-                for _, irow in intro_rows.iterrows():
-                    service_date = irow.get("service_date")
+                # itertuples(name=None) statt iterrows: keine Series pro Zeile, nur benötigte Spalten
+                for service_date, rundung, travel_time, direct_time, indirect_time in intro_rows[
+                    ["service_date", "rundung", "travel_time", "direct_time", "indirect_time"]
+                ].itertuples(index=False, name=None):
                     if service_date is None or pd.isna(service_date):
                         continue
-                    rundung = irow.get("rundung")
-                    fahrtzeit = self._round_minutes(irow.get("travel_time"), rundung)
-                    direkt = self._round_minutes(irow.get("direct_time"), rundung)
-                    indirekt = self._round_minutes(irow.get("indirect_time"), rundung)
+                    fahrtzeit = self._round_minutes(travel_time, rundung)
+                    direkt = self._round_minutes(direct_time, rundung)
+                    indirekt = self._round_minutes(indirect_time, rundung)
                     minuten_total = fahrtzeit + direkt + indirekt
                     if minuten_total == 0:
                         continue
@@ -427,12 +474,13 @@ class InvoiceProcessor:
                     # sum_kosten bleibt 0 für diese Zeilen
 
                 # Normale Positionen je Tag aggregiert
-                for _, row in date_groups.iterrows():
-                    service_date = row.get("service_date")
+                for service_date, rundung, travel_time, direct_time, indirect_time, raw_hourly_rate in date_groups[
+                    ["service_date", "rundung", "travel_time", "direct_time", "indirect_time", "hourly_rate"]
+                ].itertuples(index=False, name=None):
                     if service_date is None or pd.isna(service_date):
                         logger.error("Fehlendes Leistungsdatum bei Client {} – Zeile ignoriert.", client_id)
                         continue
-                    hourly_rate = to_float(row.get("hourly_rate"))
+                    hourly_rate = to_float(raw_hourly_rate)
                     if hourly_rate is None:
                         logger.error(
                             "Kein Stundensatz für Client {} ({}) am {} – Zeile ignoriert.",
@@ -441,10 +489,9 @@ class InvoiceProcessor:
                             service_date,
                         )
                         continue
-                    rundung = row.get("rundung")
-                    fahrtzeit = self._round_minutes(row.get("travel_time"), rundung)
-                    direkt = self._round_minutes(row.get("direct_time"), rundung)
-                    indirekt = self._round_minutes(row.get("indirect_time"), rundung)
+                    fahrtzeit = self._round_minutes(travel_time, rundung)
+                    direkt = self._round_minutes(direct_time, rundung)
+                    indirekt = self._round_minutes(indirect_time, rundung)
 
                     # Einführungsgespräch (Startmonat): kostenfreie Freiminuten von direct_time abziehen
                     if remaining_intro_minutes > 0 and direkt > 0:
@@ -548,7 +595,7 @@ class InvoiceProcessor:
                     }
                 )
 
-                with log_exceptions(f"Fehler bei PDF-Erstellung für Klient {client_id}"):
+                with log_exceptions(f"Fehler bei DOCX-Erstellung für Klient {client_id}"):
                     rendered_invoice = self.invoice_factory.render_invoice(
                         invoice_context=invoice_context,
                         jinja_env=jinja_env,
@@ -558,10 +605,25 @@ class InvoiceProcessor:
                     docx_path = output_path / docx_name
                     rendered_invoice.save(docx_path)
                     all_docx.append(docx_path)
-                    named_pdf = DocumentUtils.docx_to_pdf(docx_path, docx_path.with_suffix(".pdf"), invoice_context)
-                    invoices_for_payer.append(named_pdf)
-                    all_invoices.append(named_pdf)
-                    invoice_list.append(invoice_context)
+                    jobs_for_payer.append((docx_path, invoice_context))
+
+            payer_jobs.append((payer_id, payer_context, jobs_for_payer))
+
+        # PDF-Konvertierung über alle Kostenträger parallel, Reihenfolge der Ergebnisse bleibt erhalten
+        pdf_by_docx = self._convert_invoices_to_pdf(
+            [job for _, _, jobs_for_payer in payer_jobs for job in jobs_for_payer],
+            tmp_path,
+        )
+
+        for payer_id, payer_context, jobs_for_payer in payer_jobs:
+            invoices_for_payer: List[Path] = []
+            for docx_path, invoice_context in jobs_for_payer:
+                named_pdf = pdf_by_docx.get(docx_path)
+                if named_pdf is None:
+                    continue
+                invoices_for_payer.append(named_pdf)
+                all_invoices.append(named_pdf)
+                invoice_list.append(invoice_context)
 
             with log_exceptions(f"Fehler beim Zusammenführen der PDFs für Kostenträger {payer_id}"):
                 merged_pdf = DocumentUtils.merge_pdfs(invoices_for_payer, payer_context, output_path=output_path)
@@ -583,7 +645,8 @@ class InvoiceProcessor:
 
         if all_docx:
             docx_zip = output_path / f"Rechnungen_DOCX_{start_inv_period}_bis_{end_inv_period}.zip"
-            with ZipFile(docx_zip, "w") as zipf:
+            # DOCX ist selbst ein DEFLATE-komprimiertes ZIP; erneutes Komprimieren spart praktisch nichts
+            with ZipFile(docx_zip, "w", compression=ZIP_STORED) as zipf:
                 for file in all_docx:
                     if file.exists():
                         zipf.write(file, arcname=file.name)
@@ -84,26 +84,7 @@ def create_arbeitszeit_report(config: Config, reporting_month: str) -> Path:
 
 
 def _write_excel(df: pd.DataFrame, out_file: Path, month_str: str) -> None:
-    employees = df["Mitarbeiter"].unique()
-
-    # Summenzeilen pro Mitarbeiter
-    summary_rows = []
-    for emp in employees:
-        emp_df = df[df["Mitarbeiter"] == emp]
-        summary_rows.append(
-            {
-                "Mitarbeiter": emp,
-                "MA-ID": emp_df["MA-ID"].iloc[0],
-                "Klient": "",
-                "Klienten-ID": "",
-                "Datum": None,
-                "Fahrtzeit": emp_df["Fahrtzeit"].sum(),
-                "Direktkontakt": emp_df["Direktkontakt"].sum(),
-                "Indir. Bearbeitung": emp_df["Indir. Bearbeitung"].sum(),
-                "Total": emp_df["Total"].sum(),
-            }
-        )
-    summary_df = pd.DataFrame(summary_rows)
+    summary_df = _build_employee_summary(df)
 
     header_fill = PatternFill(start_color="2E4057", end_color="2E4057", fill_type="solid")
     header_font = Font(color="FFFFFF", bold=True)
@@ -126,7 +107,7 @@ def _write_excel(df: pd.DataFrame, out_file: Path, month_str: str) -> None:
         _format_sheet(ws_sum, summary_df, header_fill, header_font, date_fmt, int_fmt)
 
         # Subtotal-Zeilen hervorheben
-        for row_idx, (_, row) in enumerate(summary_df.iterrows(), start=2):
+        for row_idx in range(2, len(summary_df) + 2):
             for col_idx in range(1, len(summary_df.columns) + 1):
                 cell = ws_sum.cell(row=row_idx, column=col_idx)
                 cell.fill = subtotal_fill
@@ -150,6 +131,22 @@ def _write_excel(df: pd.DataFrame, out_file: Path, month_str: str) -> None:
         _write_pivot_sheet(ws_pivot, pivot_df, header_fill, header_font)
 
 
+def _build_employee_summary(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Summenzeilen pro Mitarbeiter in einem groupby-Durchlauf (statt einer Maske je Mitarbeiter).
+    Reihenfolge wie im Protokoll (sort=False); Zeilen ohne Mitarbeiter bilden eine eigene Gruppe.
+    """
+    summary_df = (
+        df.groupby("Mitarbeiter", sort=False, dropna=False)
+        .agg(**{"MA-ID": ("MA-ID", "first"), **{col: (col, "sum") for col in _TIME_COLS}})
+        .reset_index()
+    )
+    summary_df["Klient"] = ""
+    summary_df["Klienten-ID"] = ""
+    summary_df["Datum"] = None
+    return summary_df.loc[:, _HEADER]
+
+
 def _apply_table(ws, df: pd.DataFrame, name: str) -> None:
     end_col = get_column_letter(len(df.columns))
     ref = f"A1:{end_col}{len(df) + 1}"
@@ -1,4 +1,4 @@
-import os
+import io
 from pathlib import Path
 
 import docxtpl
@@ -24,28 +24,18 @@ preise = [10, 25, 50]
 jinja_env = Environment()
 jinja_env.filters["multiply_by"] = multiply_by
 
-# Schleife: Template jeweils frisch laden, Filter registrieren und rendern
-for i, preis in enumerate(preise, start=1):
-    # Template laden
-    cwd = Path(__file__).parent
-    print("Verzeichnis:", cwd)
-
-    doc = DocxTemplate(cwd / "template.docx")
-    assert doc is not None
-    print(doc)
-    print(f"{hasattr(doc, "jinja_env")= }")
+# Vorlage einmal von der Platte lesen; pro Dokument nur ein frisches DocxTemplate aus dem Speicher
+cwd = Path(__file__).parent
+print("Verzeichnis:", cwd)
+tpl_bytes = (cwd / "template.docx").read_bytes()
 
-    print("file existiert: ", os.path.exists(cwd / "template.docx"))
-    # print("Platzhalter im Template:", doc.get_undeclared_template_variables())
-
-    # exit(0)
-    # assert doc.jinja_env is not None, "Jinja2-Environment konnte nicht erzeugt werden!"
-    # doc.jinja_env.filters['multiply_by'] = multiply_by
+for i, preis in enumerate(preise, start=1):
+    doc = DocxTemplate(io.BytesIO(tpl_bytes))
 
     # Kontext für dieses Dokument
     context = {"price": preis}
 
-    # Rendern
+    # Rendern (mit dem einmal aufgebauten Environment samt Filter)
     doc.render(context, jinja_env=jinja_env)
 
     # Mit anderem Namen speichern
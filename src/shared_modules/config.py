@@ -1,13 +1,15 @@
+import copy
 import keyword
 import os
 import sys
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Type
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
 
 import yaml
-from cryptography.fernet import Fernet
 from loguru import logger
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from pydantic_models.config.database_config import DatabaseConfig
 from pydantic_models.config.entity_model_config import EntityModelConfig, FieldConfig
@@ -19,12 +21,66 @@ from pydantic_models.config.service_provider_config import ServiceProviderConfig
 from pydantic_models.config.structure_config import StructureConfig
 from pydantic_models.config.templates_config import TemplatesConfig
 
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
+
 ModelDict = Dict[str, EntityModelConfig]
 
+# Zulässige Feldtypen in den Entity-Definitionen und reservierte Python-Schlüsselwörter
+_ALLOWED_FIELD_TYPES = frozenset({"str", "float", "int", "bool", "currency"})
+_PY_KEYWORDS = frozenset(keyword.kwlist)
+
+# Ein Validator für alle Entities zusammen (Schema wird einmal beim Import gebaut)
+_MODEL_DICT_ADAPTER: TypeAdapter[ModelDict] = TypeAdapter(ModelDict)
+
+
+# Fernet-Instanzen je Schlüssel (Base64-Dekodierung und Schlüsselaufteilung nur einmal).
+# cryptography wird erst beim ersten Entschlüsseln importiert; die meisten Befehle brauchen keine Secrets.
+@lru_cache(maxsize=8)
+def _get_fernet(key_bytes: bytes) -> "Fernet":
+    from cryptography.fernet import Fernet
+
+    return Fernet(key_bytes)
+
 
 # Default-Pfad zur Konfigurationsdatei
 DEFAULT_CONFIG_PATH = Path(__file__).parent.parent.parent / ".config" / "wegpiraten_config.yaml"
 
+# libyaml-basierter Loader (C), falls PyYAML damit gebaut ist; sonst der reine Python-SafeLoader
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Geparste YAML-Dateien je Pfad: (mtime_ns, Grösse, Inhalt), LRU-begrenzt
+_YAML_CACHE_SIZE = 32
+_YAML_CACHE: "OrderedDict[Path, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+
+
+def _file_signature(path: Path) -> Tuple[int, int]:
+    """Änderungszeit (ns) und Grösse einer Datei; ändert sich bei jedem Speichern."""
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def load_yaml_config(config_path: Path) -> Dict[str, Any]:
+    """
+    Lädt eine YAML-Konfigurationsdatei und cached das Ergebnis pro Pfad.
+    Der Cache gilt, solange Änderungszeit und Grösse der Datei unverändert sind.
+    Zurückgegeben wird immer eine tiefe Kopie, damit Aufrufer den Cache nicht verändern.
+    """
+    resolved = Path(config_path).resolve()
+    mtime_ns, size = _file_signature(resolved)
+    cached = _YAML_CACHE.get(resolved)
+    if cached is not None and cached[0] == mtime_ns and cached[1] == size:
+        _YAML_CACHE.move_to_end(resolved)
+        return copy.deepcopy(cached[2])
+
+    # Rohbytes in einem Puffer übergeben: der (libyaml-)Loader dekodiert selbst (UTF-8, BOM-Erkennung)
+    data: Dict[str, Any] = yaml.load(resolved.read_bytes(), Loader=_YamlLoader) or {}
+    _YAML_CACHE[resolved] = (mtime_ns, size, data)
+    _YAML_CACHE.move_to_end(resolved)
+    while len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+        _YAML_CACHE.popitem(last=False)
+    return copy.deepcopy(data)
+
 
 class ExpectedColumnsConfig(BaseModel):
     """
@@ -54,19 +110,22 @@ class Config:
         return cls._instance
 
     def __init__(self, config_path: Optional[Path] = None):
-        # Singleton: Nur einmal initialisieren
-        if getattr(self, "_initialized", False):
+        # Singleton: Nur neu laden, wenn ein anderer Pfad verlangt wird oder sich die Datei geändert hat
+        if getattr(self, "_initialized", False) and self._is_current(config_path):
             return
+        # Bis zum erfolgreichen Abschluss gilt die Instanz als nicht initialisiert
+        self._initialized = False
 
-        # Fallback-Logger für Fehler beim Laden der Config
-        logger.remove()
-        logger.add(sys.stderr, level="WARNING")
-        self.config_path = config_path or DEFAULT_CONFIG_PATH
+        # Bis _setup_logging greift, melden die bestehenden Sinks (loguru-Standard stderr bzw. die
+        # Sinks einer zuvor geladenen Config) Fehler beim Laden; kein zusätzlicher remove/add-Zyklus
+        # Ohne Pfad bleibt eine bereits geladene Datei massgebend (Neuladen nach Änderung, kein Wechsel zum Default)
+        self.config_path = config_path or getattr(self, "config_path", None) or DEFAULT_CONFIG_PATH
         try:
+            self._config_signature = _file_signature(Path(self.config_path))
             self.raw_config: Dict[str, Any] = self._load_config()
             self.logging = self._parse_section(self.raw_config, "logging", LoggingConfig)
             self._setup_logging()
-            logger.debug(f"Lade Konfiguration von {config_path}")
+            logger.debug("Lade Konfiguration von {}", config_path)
         except Exception as e:
             logger.error(f"Fehler beim Laden der Konfiguration: {e}")
             raise
@@ -76,30 +135,53 @@ class Config:
         self.formatting = self._parse_section(self.raw_config, "formatting", FormattingConfig)
         self.service_provider = self._parse_section(self.raw_config, "service_provider", ServiceProviderConfig)
         self.templates = self._parse_section(self.raw_config, "templates", TemplatesConfig)
-        self.models = self._parse_entities(self.raw_config.get("entities", {}))
+        self.models = self._parse_entities(self.raw_config.get("entities") or {})
 
         self._validate_structure_and_paths()
         self._validate_consistency()
+
+        # Erwartete Spalten einmalig aus den Entity-Definitionen ableiten
+        self._expected_columns = self._build_expected_columns()
+        self._expected_column_names: frozenset[str] = frozenset(
+            field.name
+            for fields in (
+                self._expected_columns.payer,
+                self._expected_columns.client,
+                self._expected_columns.general,
+            )
+            for field in fields
+        )
         logger.debug("Konfiguration erfolgreich geladen und validiert.")
         self._initialized = True
 
+    def _is_current(self, config_path: Optional[Path]) -> bool:
+        """
+        Prüft, ob die geladene Konfiguration für den angefragten Pfad noch gültig ist.
+        Ohne Pfad gilt die bereits geladene Datei; ist sie nicht mehr lesbar, bleibt die Konfiguration bestehen.
+        """
+        if config_path is not None and Path(config_path).resolve() != Path(self.config_path).resolve():
+            return False
+        try:
+            return _file_signature(Path(self.config_path)) == self._config_signature
+        except OSError:
+            return True
+
     def _setup_logging(self) -> None:
         """
         Initialisiert loguru mit den Einstellungen aus der Config-Datei.
         """
         logger.remove()
-        log_file = getattr(self.logging, "log_file", None)
-        log_level = getattr(self.logging, "log_level", "DEBUG")
+        log_file = self.logging.log_file
+        log_level = self.logging.log_level or "DEBUG"
         if log_file:
             logger.add(log_file, level=log_level)
         logger.add(sys.stderr, level=log_level)
 
     def _load_config(self) -> Dict[str, Any]:
         """
-        Lädt die YAML-Konfigurationsdatei.
+        Lädt die YAML-Konfigurationsdatei (über den mtime/Grösse-validierten Cache).
         """
-        with open(self.config_path, "r") as f:
-            return yaml.safe_load(f)
+        return load_yaml_config(self.config_path)
 
     def _read_env_file(self, env_path: Path) -> Dict[str, str]:
         """
@@ -135,71 +217,69 @@ class Config:
         """
         Parst einen Abschnitt der Config mit dem passenden Pydantic-Modell.
         """
-        data = config.get(section, {})
-        logger.debug(f"Parsiere Abschnitt '{section}': {data}")
-        return model(**data)
+        data = config.get(section) or {}
+        logger.debug("Parsiere Abschnitt '{}': {}", section, data)
+        return model.model_validate(data)
 
     def _parse_entities(self, entities_dict: Dict[str, Any]) -> ModelDict:
         """
         Parst alle Entity-Modelle aus der Config mit dem statischen EntityModelConfig.
         """
-        result = {}
-        for name, entity_data in entities_dict.items():
-            logger.debug(f"Parsiere Entity-Modell '{name}': {entity_data}")
-            result[name] = EntityModelConfig(**entity_data)
-        return result
+        models = _MODEL_DICT_ADAPTER.validate_python(entities_dict)
+        logger.debug("{} Entity-Modelle geparst: {}", len(models), ", ".join(models))
+        return models
 
     def _validate_consistency(self) -> None:
         """
         Prüft, ob die Entity-Modelle und Felddefinitionen mit der Config konsistent sind.
         Prüft, ob alle Feldnamen gültige Python-Bezeichner sind und keine Schlüsselwörter.
+        Alle Verstösse werden gesammelt und gemeinsam gemeldet, damit ein Durchlauf alle Fehler zeigt.
         """
+        errors: List[str] = []
         for model_name, model_config in self.models.items():
             for field in model_config.fields:
+                name = field.name
                 # Prüfe Python-Bezeichner
-                if not field.name.isidentifier():
-                    logger.error(
-                        f"Ungültiger Feldname '{field.name}' im Modell '{model_name}' (kein gültiger Python-Bezeichner)."
-                    )
-                    raise ValueError(
-                        f"Ungültiger Feldname '{field.name}' im Modell '{model_name}' (kein gültiger Python-Bezeichner)."
+                if not name.isidentifier():
+                    errors.append(
+                        f"Ungültiger Feldname '{name}' im Modell '{model_name}' (kein gültiger Python-Bezeichner)."
                     )
-                if keyword.iskeyword(field.name):
-                    logger.error(
-                        f"Feldname '{field.name}' im Modell '{model_name}' ist ein reserviertes Python-Schlüsselwort."
-                    )
-                    raise ValueError(
-                        f"Feldname '{field.name}' im Modell '{model_name}' ist ein reserviertes Python-Schlüsselwort."
+                elif name in _PY_KEYWORDS:
+                    errors.append(
+                        f"Feldname '{name}' im Modell '{model_name}' ist ein reserviertes Python-Schlüsselwort."
                     )
                 # Typprüfung (optional, kann erweitert werden)
-                if field.type not in {"str", "float", "int", "bool", "currency"}:
-                    logger.error(f"Unbekannter Typ '{field.type}' für Feld '{field.name}' im Modell '{model_name}'.")
-                    raise ValueError(
-                        f"Unbekannter Typ '{field.type}' für Feld '{field.name}' im Modell '{model_name}'."
-                    )
+                if field.type not in _ALLOWED_FIELD_TYPES:
+                    errors.append(f"Unbekannter Typ '{field.type}' für Feld '{name}' im Modell '{model_name}'.")
+        if errors:
+            for message in errors:
+                logger.error(message)
+            raise ValueError("\n".join(errors))
 
     def _validate_structure_and_paths(self) -> None:
         """
         Prüft einmalig alle Pfad- und Pflichtangaben. Scheitern die Prüfungen,
         wird die Konfiguration verworfen.
         """
-        prj_root_raw = getattr(self.structure, "prj_root", None)
+        prj_root_raw = self.structure.prj_root
         if not prj_root_raw:
             logger.error("structure.prj_root ist nicht gesetzt.")
             raise ValueError("structure.prj_root ist Pflicht.")
 
+        # Nur die Projektwurzel wird aufgelöst; Unterpfade prüft exists() direkt (ein stat statt
+        # eines lstat je Pfadbestandteil durch resolve()). Symlinks folgt exists() ohnehin.
         prj_root = Path(prj_root_raw).expanduser().resolve()
         if not prj_root.exists():
             logger.error(f"Projektwurzel existiert nicht: {prj_root}")
             raise FileNotFoundError(f"Projektwurzel nicht gefunden: {prj_root}")
 
-        local_data_rel = getattr(self.structure, "local_data_path", None) or "data"
-        data_dir = (prj_root / local_data_rel).resolve()
+        local_data_rel = self.structure.local_data_path or "data"
+        data_dir = prj_root / local_data_rel
         if not data_dir.exists():
             logger.error(f"Datenverzeichnis existiert nicht: {data_dir}")
             raise FileNotFoundError(f"Datenverzeichnis nicht gefunden: {data_dir}")
 
-        sqlite_name = getattr(self.database, "sqlite_db_name", None)
+        sqlite_name = self.database.sqlite_db_name
         if not sqlite_name:
             logger.error("database.sqlite_db_name ist nicht gesetzt.")
             raise ValueError("database.sqlite_db_name ist Pflicht.")
@@ -209,31 +289,28 @@ class Config:
             logger.error(f"SQLite-Datenbank nicht gefunden: {db_path}")
             raise FileNotFoundError(f"SQLite-Datenbank nicht gefunden: {db_path}")
 
-        template_rel = getattr(self.structure, "template_path", None) or "templates"
-        template_dir = (prj_root / template_rel).resolve()
+        template_rel = self.structure.template_path or "templates"
+        template_dir = prj_root / template_rel
         if not template_dir.exists():
             logger.error(f"Template-Verzeichnis existiert nicht: {template_dir}")
             raise FileNotFoundError(f"Template-Verzeichnis nicht gefunden: {template_dir}")
 
         # optionale Import-Pfade prüfen, Warnung statt Fehler
-        imports_rel = getattr(self.structure, "imports_path", None)
+        imports_rel = self.structure.imports_path
         if imports_rel:
-            imports_path = (prj_root / imports_rel).resolve()
+            imports_path = prj_root / imports_rel
             if not imports_path.exists():
                 logger.warning(f"Imports-Pfad existiert nicht: {imports_path}")
 
         # Pflichtfelder für Timesheet-Layout prüfen
-        header_cfg = getattr(self.templates, "time_sheet_header_cells", None)
-        row_cfg = getattr(self.templates, "time_sheet_row_mapping", None)
-        start_cell = getattr(self.templates, "time_sheet_data_start_cell", None)
-        end_cell = getattr(self.templates, "time_sheet_data_end_cell", None)
-        missing = [
-            ("templates.time_sheet_header_cells", header_cfg),
-            ("templates.time_sheet_row_mapping", row_cfg),
-            ("templates.time_sheet_data_start_cell", start_cell),
-            ("templates.time_sheet_data_end_cell", end_cell),
-        ]
-        for field_name, value in missing:
+        templates = self.templates
+        required = (
+            ("templates.time_sheet_header_cells", templates.time_sheet_header_cells),
+            ("templates.time_sheet_row_mapping", templates.time_sheet_row_mapping),
+            ("templates.time_sheet_data_start_cell", templates.time_sheet_data_start_cell),
+            ("templates.time_sheet_data_end_cell", templates.time_sheet_data_end_cell),
+        )
+        for field_name, value in required:
             if value is None:
                 logger.error(f"{field_name} ist nicht definiert.")
                 raise ValueError(f"{field_name} ist Pflicht.")
@@ -248,7 +325,7 @@ class Config:
             if isinstance(val, dict) and part in val:
                 val = val[part]
             else:
-                logger.debug(f"Feld '{key}' nicht gefunden, Rückgabe Default: {default}")
+                logger.debug("Feld '{}' nicht gefunden, Rückgabe Default: {}", key, default)
                 return default
         return val
 
@@ -256,7 +333,7 @@ class Config:
         """
         Gibt ein Secret (z. B. Passwort, API-Key) aus Umgebungsvariablen zurück.
         """
-        logger.debug(f"Lese Secret '{key}' aus Umgebungsvariablen.")
+        logger.debug("Lese Secret '{}' aus Umgebungsvariablen.", key)
         env_val = os.getenv(key)
         if env_val is not None:
             return env_val
@@ -271,12 +348,12 @@ class Config:
         """
         encrypted = self.get_secret(key)
         fernet_key = self.get_secret(fernet_key_env)
-        logger.debug(f"Versuche Secret '{key}' mit Fernet-Key '{fernet_key_env}' zu entschlüsseln.")
+        logger.debug("Versuche Secret '{}' mit Fernet-Key '{}' zu entschlüsseln.", key, fernet_key_env)
         if not encrypted or not fernet_key:
             logger.debug("Kein Secret oder Key gefunden, Rückgabe Default.")
             return default
         try:
-            f = Fernet(fernet_key.encode())
+            f = _get_fernet(fernet_key.encode())
             decrypted = f.decrypt(encrypted.encode())
             logger.debug("Secret erfolgreich entschlüsselt.")
             return decrypted.decode()
@@ -327,7 +404,17 @@ class Config:
     def get_expected_columns(self) -> ExpectedColumnsConfig:
         """
         Gibt die erwarteten Spalten für die Rechnungsverarbeitung zurück,
-        basierend auf den Entity-Definitionen in der Config.
+        basierend auf den Entity-Definitionen in der Config (einmalig beim Laden erstellt).
+        """
+        return self._expected_columns
+
+    def get_expected_column_names(self) -> frozenset[str]:
+        """Gibt die Namen aller erwarteten Spalten (payer, client, general) zurück."""
+        return self._expected_column_names
+
+    def _build_expected_columns(self) -> ExpectedColumnsConfig:
+        """
+        Erstellt die erwarteten Spalten aus den Entity-Definitionen payer, client und invoice_data.
         """
         payer_fields = self.models.get("payer", EntityModelConfig(fields=[])).fields
         client_fields = self.models.get("client", EntityModelConfig(fields=[])).fields
@@ -340,8 +427,7 @@ class Config:
 
 
 if __name__ == "__main__":
-    config_path = Path(__file__).parent.parent.parent / ".config" / "wegpiraten_config.yaml"
-    config = Config(config_path)
+    config = Config(DEFAULT_CONFIG_PATH)
     logger.info("Projektwurzel: {}", config.structure.prj_root)
     # Validierung erfolgt beim Laden automatisch
 
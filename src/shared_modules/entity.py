@@ -4,6 +4,10 @@ from pydantic import BaseModel, field_validator, model_validator
 
 from .utils import safe_str  # Nutze zentrale Hilfsfunktion für String-Konvertierung
 
+# Felder, die vor der Validierung als str geführt werden
+_ENTITY_STR_FIELDS = ("name", "name_2", "street", "zip", "city", "zip_city", "key")
+_PRIVATE_STR_FIELDS = ("first_name", "last_name", "birth_date", "social_security_number")
+
 
 class Entity(BaseModel):
     """
@@ -21,31 +25,39 @@ class Entity(BaseModel):
     zip_city: str = ""
     key: str = ""
 
-    @model_validator(mode="before")
-    def ensure_str_fields(cls, data):
+    @classmethod
+    def _normalize_entity_input(cls, data: dict) -> dict:
         """
-        Sorgt dafür, dass alle string-Felder wirklich als str vorliegen.
-        Das verhindert Validierungsfehler, wenn z.B. PLZ als int aus einer Datenquelle kommt.
+        Bereitet die Eingabe in einem Durchgang vor der Validierung auf (arbeitet auf einer Kopie):
+        - Alle string-Felder werden als str geführt (z.B. PLZ als int aus einer Datenquelle).
+        - Wenn zip_city gesetzt ist, werden zip und city daraus extrahiert.
+        - Wenn zip_city leer ist, aber zip oder city gesetzt sind, wird zip_city zusammengesetzt.
         """
-        for field in ["name", "name_2", "street", "zip", "city", "zip_city", "key"]:
-            if field in data:
+        data = dict(data)
+        for field in _ENTITY_STR_FIELDS:
+            # Bereits als str vorliegende Werte (der Normalfall) ohne Funktionsaufruf übernehmen
+            if field in data and type(data[field]) is not str:
                 data[field] = safe_str(data[field])
+        zip_city = data.get("zip_city", "")
+        if zip_city:
+            # Ohne Leerzeichen liefert partition einen leeren Ort (wie bisher)
+            data["zip"], _, data["city"] = zip_city.strip().partition(" ")
+        else:
+            zip_code = data.get("zip", "")
+            city = data.get("city", "")
+            if zip_code or city:
+                data["zip_city"] = f"{zip_code} {city}".strip()
         return data
 
-    @model_validator(mode="after")
-    def sync_zip_city(self) -> "Entity":
+    @model_validator(mode="before")
+    @classmethod
+    def normalize_fields(cls, data):
         """
-        Synchronisiert zip, city und zip_city nach der Initialisierung.
-        - Wenn zip_city gesetzt ist, werden zip und city daraus extrahiert.
-        - Wenn zip_city leer ist, aber zip oder city gesetzt sind, wird zip_city zusammengesetzt.
+        Normalisiert Dict-Eingaben vor der Validierung (siehe _normalize_entity_input).
         """
-        if self.zip_city:
-            parts = self.zip_city.strip().split(" ", 1)
-            self.zip = parts[0] if len(parts) > 0 else ""
-            self.city = parts[1] if len(parts) > 1 else ""
-        elif self.zip or self.city:
-            self.zip_city = f"{self.zip} {self.city}".strip()
-        return self
+        if not isinstance(data, dict):
+            return data
+        return cls._normalize_entity_input(data)
 
     @field_validator("name_2", mode="after")
     def empty_name_2(cls, v: str) -> str:
@@ -91,27 +103,23 @@ class PrivatePerson(Entity):
     social_security_number: str = ""  # Sozialversicherungsnummer
 
     @model_validator(mode="before")
-    def ensure_private_str_fields(cls, data):
-        """
-        Sorgt dafür, dass alle string-Felder wirklich als str vorliegen.
-        """
-        for field in ["first_name", "last_name", "birth_date", "social_security_number"]:
-            if field in data and data[field] is not None:
-                data[field] = safe_str(data[field])
+    @classmethod
+    def normalize_fields(cls, data):
+        """
+        Ergänzt die Aufbereitung der Basisklasse um die Personenfelder und setzt name
+        aus last_name und first_name, falls name nicht explizit gesetzt ist.
+        """
+        if not isinstance(data, dict):
+            return data
+        data = cls._normalize_entity_input(data)
+        for field in _PRIVATE_STR_FIELDS:
+            value = data.get(field)
+            if value is not None and type(value) is not str:
+                data[field] = safe_str(value)
+        if not data.get("name"):
+            data["name"] = f"{data.get('last_name', '')}, {data.get('first_name', '')}".strip(", ")
         return data
 
-    @field_validator("name", mode="after")
-    def set_name_if_empty(cls, v: str, info) -> str:
-        """
-        Setzt name automatisch, falls nicht explizit gesetzt.
-        Nutzt last_name und first_name, falls name leer ist.
-        """
-        if not v:
-            last_name = info.data.get("last_name", "")
-            first_name = info.data.get("first_name", "")
-            return f"{last_name}, {first_name}".strip(", ")
-        return v
-
     def as_dict(self) -> dict:
         """
         Gibt die Felder als Dictionary zurück, inkl. Felder aus Entity.
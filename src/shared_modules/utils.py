@@ -3,13 +3,13 @@ import re
 import tempfile
 from contextlib import contextmanager
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Dict, Generator, List, Optional, Tuple
-from zipfile import ZipFile
+from zipfile import ZIP_STORED, ZipFile
 
 from loguru import logger
-from openpyxl.utils.cell import coordinate_from_string
-from pydantic import BaseModel, ValidationError, field_validator
+from pydantic import BaseModel, field_validator
 
 
 def clear_path(path: Path) -> None:
@@ -20,9 +20,11 @@ def clear_path(path: Path) -> None:
     Args:
         path (Path): Das Verzeichnis, dessen Dateien gelöscht werden sollen.
     """
-    for item in path.iterdir():
-        if item.is_file():
-            item.unlink()
+    # scandir liefert den Dateityp aus dem Verzeichniseintrag mit (kein zusätzliches stat pro Datei)
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_file():
+                os.unlink(entry.path)
 
 
 class PDFList(BaseModel):
@@ -47,21 +49,26 @@ class PDFList(BaseModel):
 def zip_invoices(pdf_files: List[Path], zip_path: Path) -> None:
     """
     Erstellt ein ZIP-Archiv aus einer Liste von PDF-Dateien.
-    Nutzt ein Pydantic-Modell zur Validierung der Dateiliste.
+    Vor dem Schreiben wird geprüft, ob alle Dateien existieren; fehlende werden gemeinsam gemeldet.
 
     Args:
         pdf_files (List[Path]): Liste von PDF-Dateipfaden.
         zip_path (Path): Zielpfad für das ZIP-Archiv.
-    """
-    # Validierung der Eingabe mit Pydantic
-    try:
-        pdf_list = PDFList(pdf_files=pdf_files)
-    except ValidationError as e:
-        logger.error(f"Ungültige PDF-Dateiliste: {e}")
-        raise
 
-    with ZipFile(zip_path, "w") as zipf:
-        for file in pdf_list.pdf_files:
+    Raises:
+        FileNotFoundError: Wenn mindestens eine Datei fehlt (es wird kein Archiv angelegt).
+    """
+    # Direkte Existenzprüfung statt PDFList-Modell: ein stat pro Datei, keine Pydantic-Validierung
+    missing = [file for file in pdf_files if not file.exists()]
+    if missing:
+        listing = ", ".join(str(file) for file in missing)
+        logger.error(f"Ungültige PDF-Dateiliste, Dateien nicht gefunden: {listing}")
+        raise FileNotFoundError(f"Dateien nicht gefunden: {listing}")
+
+    # Bewusst ohne Kompression: LibreOffice-PDFs sind intern bereits Flate-komprimiert,
+    # DEFLATE brächte kaum kleinere Archive bei deutlich mehr CPU-Zeit.
+    with ZipFile(zip_path, "w", compression=ZIP_STORED) as zipf:
+        for file in pdf_files:
             zipf.write(file, arcname=file.name)
 
 
@@ -112,40 +119,92 @@ def temporary_docx(suffix: str = ".docx") -> Generator[Path, None, None]:
             ...
         # Nach dem Block wird die Datei gelöscht.
     """
-    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-        tmp_path = Path(tmp.name)
+    # mkstemp legt die Datei sicher an, ohne Python-Dateiobjekt; der Handle wird sofort geschlossen
+    fd, name = tempfile.mkstemp(suffix=suffix)
+    os.close(fd)
+    tmp_path = Path(name)
     try:
         yield tmp_path
     finally:
-        if tmp_path.exists():
-            os.remove(tmp_path)
+        # Ein unlink statt exists() + remove(); bereits gelöschte Dateien sind kein Fehler
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+
+
+# Typnamen aus der Konfiguration → Python-Typ (einmal pro Prozess aufgebaut)
+_TYPE_MAP: Dict[str, type] = {
+    "str": str,
+    "float": float,
+    "int": int,
+    "bool": bool,
+}
 
 
 # Hilfsfunktion für Typumwandlung (wird für dynamische Modell-Erzeugung benötigt)
-def get_type_from_str(type_str: str):
-    mapping = {
-        "str": str,
-        "float": float,
-        "int": int,
-        "bool": bool,
-    }
-    return mapping.get(type_str, str)
+def get_type_from_str(type_str: str) -> type:
+    """Wandelt einen Typnamen als String in einen Python-Typ um (unbekannte Namen → str)."""
+    return _TYPE_MAP.get(type_str, str)
 
 
 # Datumsformate für freie Texteingaben
 DATE_FORMATS: tuple[str, ...] = ("%Y-%m-%d", "%d.%m.%Y", "%Y/%m/%d", "%m.%Y")
 
 
+# Tausendertrennzeichen entfernen und Dezimalkomma normalisieren – in einem Durchlauf
+_FLOAT_STR_TRANSLATION = str.maketrans({"’": None, "'": None, " ": None, ",": "."})
+
+
 def _parse_float_str(s: str) -> Optional[float]:
-    s = s.strip().replace("’", "").replace("'", "").replace(" ", "").replace(",", ".")
+    s = s.strip().translate(_FLOAT_STR_TRANSLATION)
     try:
         return float(s)
     except ValueError:
         return None
 
 
+@lru_cache(maxsize=4096)
+def parse_ch_date(value: str) -> Optional[date]:
+    """
+    Parst ein Datum im Format TT.MM.JJJJ (auch T.M.JJJJ) direkt über die Ziffernteile, ohne strptime.
+    Dieselben Datumswerte wiederholen sich (Perioden, Importzeilen), daher der Cache.
+
+    Returns:
+        Optional[date]: Datum oder None, wenn die Form nicht passt oder das Datum ungültig ist.
+    """
+    parts = value.split(".")
+    if len(parts) != 3:
+        return None
+    day, month, year = parts
+    if not (len(day) in (1, 2) and len(month) in (1, 2) and len(year) == 4):
+        return None
+    if not all(part.isascii() and part.isdigit() for part in parts):
+        return None
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+def _parse_date_fast(s: str) -> Optional[date]:
+    """
+    Schneller Pfad für die häufigsten Formate ohne strptime: YYYY-MM-DD (ISO) und TT.MM.JJJJ.
+    Liefert None, wenn die Form nicht passt; die Prüfung über DATE_FORMATS bleibt massgebend.
+    """
+    if len(s) == 10 and s[4] == "-" and s[7] == "-":
+        try:
+            return date.fromisoformat(s)
+        except ValueError:
+            return None
+    return parse_ch_date(s)
+
+
 def _parse_date_str(s: str) -> Optional[date]:
     s = s.strip()
+    parsed = _parse_date_fast(s)
+    if parsed is not None:
+        return parsed
     for fmt in DATE_FORMATS:
         try:
             d = datetime.strptime(s, fmt)
@@ -207,15 +266,15 @@ def ensure_dir(path: Path) -> Path:
 # Hinweis: Alle Formatierungen für Zahlen, Währungen und Datumsfelder erfolgen ausschließlich im Template
 # über Babel/Jinja2-Filter und die Konfiguration. Keine eigene Formatierungsfunktion mehr nötig.
 
-_CELL_RE = re.compile(r"^[A-Za-z]+[0-9]+$")
+# Spalte (max. drei Buchstaben) und Zeile ab 1 – in einem Durchgang geprüft und zerlegt
+_CELL_RE = re.compile(r"^([A-Z]{1,3})([0-9]+)$")
 
 
 def split_cell_address(address: str) -> Tuple[str, int]:
-    addr = address.strip().upper()
-    if not _CELL_RE.match(addr):
+    match = _CELL_RE.match(address.strip().upper())
+    if match is None or int(match.group(2)) < 1:
         raise ValueError(f"Ungültige Zelladresse: {address}")
-    col, row = coordinate_from_string(addr)
-    return col, int(row)
+    return match.group(1), int(match.group(2))
 
 
 def derive_table_range(start_cell: str, end_cell: str) -> Tuple[str, int, str, int]:
@@ -1,35 +1,18 @@
-from pathlib import Path
+import sys
+from typing import List, Optional
 
-from loguru import logger
+from cli import app
 
-from shared_modules.config import Config
-from shared_modules.utils import ensure_dir
-from time_sheets.modules.time_sheet_batch_processor import TimeSheetBatchProcessor
-from time_sheets.modules.time_sheet_factory import TimeSheetFactory
 
-
-def main() -> None:
+def main(argv: Optional[List[str]] = None) -> None:
     """
     Einstiegspunkt für das Anlegen eines neuen Berichtsmonats.
-    Vertraut auf die (bereits beim Laden geprüfte) Config, leitet Pfade ab
-    und erstellt anschließend mit Factory + Processor alle Zeiterfassungs-Sheets.
+    Delegiert an den CLI-Befehl `timesheet` (Config, Logging, Factory + Processor),
+    der Monat wird als Argument übergeben statt im Skript fest codiert.
+    Aufruf: python -m time_sheets.create_new_time_sheets_batch 2026-03
     """
-    config_path: Path = Path(__file__).parents[2] / ".config" / "wegpiraten_config.yaml"
-    config = Config(config_path)
-
-    structure = config.structure
-    prj_root = Path(structure.prj_root)
-
-    # Aus den (validierten) Config-Pfaden die Ziel-/Template-Verzeichnisse ableiten.
-    output_path = ensure_dir(prj_root / (structure.output_path or "output"))
-    template_path = prj_root / (structure.template_path or "templates")
-
-    factory = TimeSheetFactory(config)
-    processor = TimeSheetBatchProcessor(config, factory)
-
-    reporting_month = "2025-10"
-    logger.info(f"Starte Batch-Erstellung für {reporting_month}.")
-    processor.run(reporting_month, output_path, template_path)
+    args = sys.argv[1:] if argv is None else argv
+    app(args=["timesheet", *args], prog_name="create_new_time_sheets_batch")
 
 
 if __name__ == "__main__":
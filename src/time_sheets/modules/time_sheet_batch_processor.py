@@ -5,15 +5,17 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
-import pandas as pd
 from loguru import logger
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from pydantic_models.data.header_data_model import HeaderDataModel
-from shared_modules.config import Config
+from shared_modules.config import DEFAULT_CONFIG_PATH, Config
 from shared_modules.utils import ensure_dir
 from time_sheets.modules.time_sheet_factory import TimeSheetFactory
 
+# Ein vorab gebauter Validator für die ganze Client-Liste (statt Modellaufruf pro Zeile)
+_HEADER_LIST_ADAPTER: TypeAdapter[List[HeaderDataModel]] = TypeAdapter(List[HeaderDataModel])
+
 
 class TimeSheetBatchProcessor:
     """
@@ -84,15 +86,22 @@ class TimeSheetBatchProcessor:
         """
 
         logger.info(f"Führe Client-Query für Monat {reporting_month} aus.")
+        # Zeilen direkt als Dicts holen: kein DataFrame nötig, und NULL bleibt None (pandas machte daraus NaN)
         with sqlite3.connect(self.db_path) as conn:
-            df = pd.read_sql_query(sql, conn, params=[month_start])
-        logger.info(f"{len(df)} Klientendatensätze geladen.")
+            conn.row_factory = sqlite3.Row
+            records = [dict(row) for row in conn.execute(sql, (month_start,)).fetchall()]
+        logger.info(f"{len(records)} Klientendatensätze geladen.")
+
+        try:
+            return _HEADER_LIST_ADAPTER.validate_python(records)
+        except ValidationError:
+            # Nur im Fehlerfall zeilenweise validieren: ungültige Zeilen melden und überspringen
+            pass
 
         headers: List[HeaderDataModel] = []
-        for idx, row in df.iterrows():
+        for idx, record in enumerate(records):
             try:
-                row_dict = {str(key): value for key, value in row.to_dict().items()}
-                headers.append(HeaderDataModel.model_validate(row_dict))
+                headers.append(HeaderDataModel.model_validate(record))
             except ValidationError as exc:
                 logger.error(f"Ungültige Reporting-Daten in Zeile {idx}: {exc}")
 
@@ -130,8 +139,7 @@ class TimeSheetBatchProcessor:
 
 
 if __name__ == "__main__":
-    config_path = Path(__file__).parents[3] / ".config" / "wegpiraten_config.yaml"
-    config = Config(config_path)
+    config = Config(DEFAULT_CONFIG_PATH)
     factory = TimeSheetFactory(config)
     processor = TimeSheetBatchProcessor(config, factory)
     processor.run("2025-08")
@@ -11,10 +11,10 @@ from openpyxl import load_workbook
 from openpyxl.workbook.workbook import Workbook
 from pydantic import ValidationError
 
-from pydantic_models.config.config_data import TimeSheetHeaderCells, TimeSheetRowMapping
 from pydantic_models.config.entity_model_config import EntityModelConfig
+from pydantic_models.config.templates_config import TimeSheetHeaderCells, TimeSheetRowMapping
 from pydantic_models.data.header_data_model import HeaderDataModel
-from shared_modules.config import Config
+from shared_modules.config import DEFAULT_CONFIG_PATH, Config
 from shared_modules.utils import derive_table_range, ensure_dir
 
 
@@ -36,15 +36,9 @@ class TimeSheetFactory:
         self._validate_header_model()
 
         self.prj_root: Path = Path(self.config.structure.prj_root)
-        self.data_dir: Path = ensure_dir(
-            self.prj_root / (getattr(self.config.structure, "local_data_path", None) or "data")
-        )
-        self.output_dir: Path = ensure_dir(
-            self.prj_root / (getattr(self.config.structure, "output_path", None) or "output")
-        )
-        self.template_dir: Path = ensure_dir(
-            self.prj_root / (getattr(self.config.structure, "template_path", None) or "templates")
-        )
+        self.data_dir: Path = ensure_dir(self.prj_root / (self.config.structure.local_data_path or "data"))
+        self.output_dir: Path = ensure_dir(self.prj_root / (self.config.structure.output_path or "output"))
+        self.template_dir: Path = ensure_dir(self.prj_root / (self.config.structure.template_path or "templates"))
 
         self.db_path: Path = self.data_dir / self.config.database.sqlite_db_name
         self.template_file: Path = self.template_dir / self.config.templates.reporting_template
@@ -275,8 +269,7 @@ class TimeSheetFactory:
 
 
 if __name__ == "__main__":
-    config_path = Path(__file__).parents[3] / ".config" / "wegpiraten_config.yaml"
-    config = Config(config_path)
+    config = Config(DEFAULT_CONFIG_PATH)
     factory = TimeSheetFactory(config)
     reporting_month = "2025-10"
     reporting_rows = factory.fetch_reporting_data(reporting_month)
@@ -0,0 +1,31 @@
+"""
+Gemeinsame Fixtures für die Tests.
+"""
+
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+import yaml
+from loguru import logger
+
+from shared_modules.config import DEFAULT_CONFIG_PATH, Config
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Iterator[Path]:
+    """Minimales Projektverzeichnis mit der Repo-Konfiguration, umgebogen auf tmp_path."""
+    raw = yaml.safe_load(DEFAULT_CONFIG_PATH.read_text(encoding="utf-8"))
+    raw["structure"]["prj_root"] = str(tmp_path)
+    raw["structure"].pop("imports_path", None)
+    raw["logging"]["log_file"] = str(tmp_path / "wegpiraten.log")
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / raw["database"]["sqlite_db_name"]).touch()
+    (tmp_path / "templates").mkdir()
+    config_file = tmp_path / "wegpiraten_config.yaml"
+    config_file.write_text(yaml.safe_dump(raw, allow_unicode=True), encoding="utf-8")
+
+    Config._instance = None
+    yield config_file
+    Config._instance = None
+    logger.remove()
@@ -0,0 +1,42 @@
+"""
+Tests für die Summenzeilen pro Mitarbeiter im Arbeitszeitprotokoll.
+"""
+
+from datetime import date
+
+import pandas as pd
+
+from reports.arbeitszeit_report import _HEADER, _build_employee_summary
+
+
+def _protokoll(rows: list) -> pd.DataFrame:
+    return pd.DataFrame(rows, columns=_HEADER)
+
+
+def test_sums_per_employee_in_protocol_order():
+    df = _protokoll(
+        [
+            ["Zürcher Anna", 7, "Klient A", 1, date(2026, 3, 2), 10, 60, 5, 75],
+            ["Zürcher Anna", 7, "Klient B", 2, date(2026, 3, 3), 0, 30, 0, 30],
+            ["Amrein Beat", 3, "Klient A", 1, date(2026, 3, 2), 15, 45, 10, 70],
+        ]
+    )
+    summary_df = _build_employee_summary(df)
+    assert list(summary_df.columns) == _HEADER
+    assert list(summary_df["Mitarbeiter"]) == ["Zürcher Anna", "Amrein Beat"]
+    assert list(summary_df["MA-ID"]) == [7, 3]
+    assert list(summary_df["Total"]) == [105, 70]
+    assert summary_df["Datum"].isna().all()
+
+
+def test_rows_without_employee_name_are_kept():
+    """Leistungen ohne zugeordneten Mitarbeiter (LEFT JOIN) gehen nicht verloren."""
+    df = _protokoll(
+        [
+            [None, 9, "Klient A", 1, date(2026, 3, 2), 5, 20, 0, 25],
+            ["Amrein Beat", 3, "Klient A", 1, date(2026, 3, 2), 15, 45, 10, 70],
+        ]
+    )
+    summary_df = _build_employee_summary(df)
+    assert len(summary_df) == 2
+    assert summary_df["Total"].sum() == 95
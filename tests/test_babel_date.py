@@ -0,0 +1,18 @@
+"""
+Tests für den Jinja2-Filter babel_date.
+"""
+
+from datetime import date
+
+from invoices.modules.filters import babel_date
+
+
+def test_ch_date_string_is_formatted():
+    assert babel_date("1.2.2026", date_format="dd.MM.yyyy") == "01.02.2026"
+    assert babel_date(date(2026, 2, 1), date_format="dd.MM.yyyy") == "01.02.2026"
+
+
+def test_unparsable_string_is_returned_unchanged():
+    assert babel_date("1.1.26") == "1.1.26"
+    assert babel_date("31.02.2026") == "31.02.2026"
+    assert babel_date(None) == ""
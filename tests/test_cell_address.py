@@ -0,0 +1,24 @@
+"""
+Tests für split_cell_address und derive_table_range (Zelladressen aus der Config).
+"""
+
+import pytest
+
+from shared_modules.utils import derive_table_range, split_cell_address
+
+
+def test_split_normalizes_case_and_whitespace():
+    assert split_cell_address(" b12 ") == ("B", 12)
+    assert split_cell_address("A01") == ("A", 1)
+
+
+@pytest.mark.parametrize("address", ["AAAA1", "A0", "1A", "A", "$A$1", "A1B", ""])
+def test_invalid_addresses_raise_value_error(address: str):
+    with pytest.raises(ValueError):
+        split_cell_address(address)
+
+
+def test_end_above_start_is_rejected():
+    assert derive_table_range("A10", "H40") == ("A", 10, "H", 40)
+    with pytest.raises(ValueError):
+        derive_table_range("A10", "H9")
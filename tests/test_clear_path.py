@@ -0,0 +1,18 @@
+"""
+Tests für clear_path (Leeren des temporären Verzeichnisses).
+"""
+
+from pathlib import Path
+
+from shared_modules.utils import clear_path
+
+
+def test_files_removed_subdirectories_kept(tmp_path: Path):
+    (tmp_path / "a.docx").write_bytes(b"")
+    (tmp_path / "b.pdf").write_bytes(b"")
+    sub = tmp_path / "unterordner"
+    sub.mkdir()
+    (sub / "c.pdf").write_bytes(b"")
+    clear_path(tmp_path)
+    assert sorted(item.name for item in tmp_path.iterdir()) == ["unterordner"]
+    assert (sub / "c.pdf").exists()
@@ -0,0 +1,33 @@
+"""
+Tests für verschlüsselte Secrets (Fernet) in Config.
+"""
+
+from pathlib import Path
+
+import pytest
+from cryptography.fernet import Fernet
+
+from shared_modules.config import Config
+
+
+def test_decrypted_secret_round_trip(project: Path, monkeypatch: pytest.MonkeyPatch):
+    key = Fernet.generate_key()
+    monkeypatch.setenv("FERNET_KEY", key.decode())
+    monkeypatch.setenv("SHEET_PASSWORD_ENC", Fernet(key).encrypt(b"geheim").decode())
+    config = Config(project)
+    assert config.get_decrypted_secret("SHEET_PASSWORD_ENC") == "geheim"
+    # Zweiter Aufruf nutzt die gecachte Fernet-Instanz und liefert dasselbe Ergebnis
+    assert config.get_decrypted_secret("SHEET_PASSWORD_ENC") == "geheim"
+
+
+def test_wrong_key_raises(project: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("FERNET_KEY", Fernet.generate_key().decode())
+    monkeypatch.setenv("SHEET_PASSWORD_ENC", Fernet(Fernet.generate_key()).encrypt(b"geheim").decode())
+    with pytest.raises(RuntimeError):
+        Config(project).get_decrypted_secret("SHEET_PASSWORD_ENC")
+
+
+def test_missing_secret_returns_default(project: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv("SHEET_PASSWORD_ENC", raising=False)
+    monkeypatch.setenv("FERNET_KEY", Fernet.generate_key().decode())
+    assert Config(project).get_decrypted_secret("SHEET_PASSWORD_ENC", default="x") == "x"
@@ -0,0 +1,42 @@
+"""
+Tests für das Singleton-Verhalten von Config (Wiederverwendung und Neuladen).
+"""
+
+import os
+from pathlib import Path
+
+import yaml
+
+from shared_modules.config import Config
+
+
+def _set_locale(config_file: Path, locale: str) -> None:
+    raw = yaml.safe_load(config_file.read_text(encoding="utf-8"))
+    raw["formatting"]["locale"] = locale
+    stat = config_file.stat()
+    config_file.write_text(yaml.safe_dump(raw, allow_unicode=True), encoding="utf-8")
+    # Änderungszeit sicher verschieben, auch bei grober Zeitauflösung des Dateisystems
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_repeat_construction_reuses_loaded_sections(project: Path):
+    first = Config(project)
+    formatting = first.formatting
+    assert Config(project) is first
+    assert Config().formatting is formatting
+
+
+def test_changed_file_is_reloaded(project: Path):
+    config = Config(project)
+    _set_locale(project, "fr_CH")
+    assert Config(project).formatting.locale == "fr_CH"
+    assert config.formatting.locale == "fr_CH"
+
+
+def test_changed_custom_file_is_reloaded_without_path(project: Path):
+    """Config() ohne Pfad lädt die geänderte eigene Datei neu, nicht die Default-Konfiguration."""
+    Config(project)
+    _set_locale(project, "it_CH")
+    config = Config()
+    assert Path(config.config_path) == project
+    assert config.formatting.locale == "it_CH"
@@ -0,0 +1,26 @@
+"""
+Tests für die Konsistenzprüfung der Entity-Felder in Config.
+"""
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from shared_modules.config import Config
+
+
+def test_all_field_errors_are_reported_together(project: Path):
+    raw = yaml.safe_load(project.read_text(encoding="utf-8"))
+    fields = raw["entities"]["payer"]["fields"]
+    fields.append({"name": "class", "type": "str", "excel_column": "class"})
+    fields.append({"name": "plz-ort", "type": "str", "excel_column": "plz_ort"})
+    fields.append({"name": "rabatt", "type": "percent", "excel_column": "rabatt"})
+    project.write_text(yaml.safe_dump(raw, allow_unicode=True), encoding="utf-8")
+
+    with pytest.raises(ValueError) as exc_info:
+        Config(project)
+    message = str(exc_info.value)
+    assert "'class'" in message and "Schlüsselwort" in message
+    assert "'plz-ort'" in message
+    assert "'percent'" in message
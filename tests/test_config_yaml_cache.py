@@ -0,0 +1,36 @@
+"""
+Tests für load_yaml_config (YAML-Cache mit mtime/Grösse-Validierung).
+"""
+
+from pathlib import Path
+
+from shared_modules.config import load_yaml_config
+
+
+def _write(path: Path, text: str) -> Path:
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_returns_parsed_content(tmp_path: Path):
+    config_file = _write(tmp_path / "config.yaml", "structure:\n  prj_root: /tmp\n")
+    assert load_yaml_config(config_file) == {"structure": {"prj_root": "/tmp"}}
+
+
+def test_cached_result_is_isolated_copy(tmp_path: Path):
+    """Änderungen am Rückgabewert dürfen spätere Aufrufe nicht beeinflussen."""
+    config_file = _write(tmp_path / "config.yaml", "structure:\n  prj_root: /tmp\n")
+    first = load_yaml_config(config_file)
+    first["structure"]["prj_root"] = "/verändert"
+    assert load_yaml_config(config_file)["structure"]["prj_root"] == "/tmp"
+
+
+def test_changed_file_is_reloaded(tmp_path: Path):
+    config_file = _write(tmp_path / "config.yaml", "formatting:\n  locale: de_CH\n")
+    assert load_yaml_config(config_file)["formatting"]["locale"] == "de_CH"
+    _write(config_file, "formatting:\n  locale: fr_CH_neu\n")
+    assert load_yaml_config(config_file)["formatting"]["locale"] == "fr_CH_neu"
+
+
+def test_empty_file_yields_empty_dict(tmp_path: Path):
+    assert load_yaml_config(_write(tmp_path / "leer.yaml", "")) == {}
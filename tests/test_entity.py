@@ -0,0 +1,32 @@
+"""
+Tests für die Normalisierung von Entity, LegalPerson und PrivatePerson.
+"""
+
+from shared_modules.entity import LegalPerson, PrivatePerson
+
+
+def test_zip_city_is_split():
+    person = LegalPerson(zip_city="8000 Zürich", key=17)
+    assert (person.zip, person.city, person.key) == ("8000", "Zürich", "17")
+
+
+def test_zip_city_is_composed():
+    person = LegalPerson(zip=3000, city="Bern", name_2="(leer)")
+    assert person.zip_city == "3000 Bern"
+    assert person.name_2 == ""
+
+
+def test_private_person_name_from_parts():
+    assert PrivatePerson(first_name="Anna", last_name="Muster").name == "Muster, Anna"
+    assert PrivatePerson(name="Explizit", first_name="Anna").name == "Explizit"
+    assert PrivatePerson().name == ""
+
+
+def test_instance_is_accepted_unchanged():
+    person = PrivatePerson(first_name="Anna", last_name="Muster", zip_city="8000 Zürich")
+    assert PrivatePerson.model_validate(person) is person
+
+
+def test_zip_city_without_space():
+    person = LegalPerson(zip_city=" 8000 ")
+    assert (person.zip, person.city) == ("8000", "")
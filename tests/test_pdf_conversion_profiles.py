@@ -0,0 +1,30 @@
+"""
+Tests für die LibreOffice-Profile der parallelen PDF-Konvertierung.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pytest
+
+from invoices.modules.document_utils import DocumentUtils
+from invoices.modules.invoice_processor import InvoiceProcessor
+
+
+def test_profiles_removed_after_conversion(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    used_profiles: List[Path] = []
+
+    def fake_batch(docx_paths: List[Path], profile_dir: Optional[Path] = None) -> Dict[Path, Optional[Path]]:
+        assert profile_dir is not None and profile_dir.is_dir()
+        used_profiles.append(profile_dir)
+        return {docx_path: docx_path.with_suffix(".pdf") for docx_path in docx_paths}
+
+    monkeypatch.setattr(DocumentUtils, "docx_batch_to_pdf", staticmethod(fake_batch))
+    jobs = [(tmp_path / f"RE {idx}.docx", None) for idx in range(3)]
+    processor = InvoiceProcessor.__new__(InvoiceProcessor)
+    result = processor._convert_invoices_to_pdf(jobs, tmp_path)  # type: ignore[arg-type]
+
+    assert set(result) == {docx_path for docx_path, _ in jobs}
+    assert used_profiles and all(profile.is_relative_to(tmp_path) for profile in used_profiles)
+    assert not any(profile.exists() for profile in used_profiles)
+    assert list(tmp_path.iterdir()) == []
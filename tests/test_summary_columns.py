@@ -0,0 +1,31 @@
+"""
+Tests für die Spaltenadressierung der Rechnungsübersicht (Excel-Spaltenbuchstaben).
+"""
+
+import pandas as pd
+import pytest
+
+from invoices.modules.document_utils import _summary_column_index, _summary_column_letter
+
+
+def _frame(column_count: int) -> pd.DataFrame:
+    return pd.DataFrame(columns=[f"Spalte {idx}" for idx in range(1, column_count + 1)])
+
+
+def test_first_column():
+    assert _summary_column_letter(_frame(3), "Spalte 1") == "A"
+
+
+def test_columns_beyond_z():
+    """Ab der 27. Spalte zweistellige Buchstaben statt Zeichen hinter 'Z'."""
+    summary_df = _frame(30)
+    assert _summary_column_letter(summary_df, "Spalte 26") == "Z"
+    assert _summary_column_letter(summary_df, "Spalte 27") == "AA"
+    assert _summary_column_letter(summary_df, "Spalte 30") == "AD"
+    assert _summary_column_index(summary_df, "Spalte 30") == 30
+
+
+def test_duplicate_column_rejected():
+    summary_df = pd.DataFrame(columns=["Betrag", "Betrag"])
+    with pytest.raises(ValueError):
+        _summary_column_letter(summary_df, "Betrag")
@@ -0,0 +1,30 @@
+"""
+Tests für TemplateCacheEnvironment (Wiederverwendung kompilierter String-Templates).
+"""
+
+from invoices.modules.filters import TemplateCacheEnvironment
+
+
+def test_same_source_is_compiled_once():
+    env = TemplateCacheEnvironment()
+    first = env.from_string("Betrag: {{ betrag }}")
+    assert env.from_string("Betrag: {{ betrag }}") is first
+    assert first.render(betrag=12) == "Betrag: 12"
+    assert first.render(betrag=7) == "Betrag: 7"
+
+
+def test_autoescape_change_compiles_new_template():
+    env = TemplateCacheEnvironment()
+    plain = env.from_string("{{ text }}")
+    env.autoescape = True
+    escaped = env.from_string("{{ text }}")
+    assert escaped is not plain
+    assert escaped.render(text="<b>") == "&lt;b&gt;"
+    assert plain.render(text="<b>") == "<b>"
+
+
+def test_globals_bypass_cache():
+    env = TemplateCacheEnvironment()
+    template = env.from_string("{{ ort }}", globals={"ort": "Bern"})
+    assert template.render() == "Bern"
+    assert env.from_string("{{ ort }}", globals={"ort": "Thun"}).render() == "Thun"
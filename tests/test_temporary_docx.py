@@ -0,0 +1,18 @@
+"""
+Tests für temporary_docx (temporäre Dateien mit automatischem Aufräumen).
+"""
+
+from shared_modules.utils import temporary_docx
+
+
+def test_file_exists_inside_and_is_removed_after():
+    with temporary_docx() as tmp_path:
+        assert tmp_path.exists()
+        assert tmp_path.suffix == ".docx"
+    assert not tmp_path.exists()
+
+
+def test_file_deleted_inside_block_is_no_error():
+    with temporary_docx(suffix=".pdf") as tmp_path:
+        tmp_path.unlink()
+    assert not tmp_path.exists()
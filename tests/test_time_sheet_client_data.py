@@ -0,0 +1,62 @@
+"""
+Tests für TimeSheetBatchProcessor.load_client_data (Client-Query und Validierung).
+"""
+
+import sqlite3
+from pathlib import Path
+
+from shared_modules.config import Config
+from time_sheets.modules.time_sheet_batch_processor import TimeSheetBatchProcessor
+
+
+def _create_db(db_path: Path) -> None:
+    with sqlite3.connect(db_path) as conn:
+        conn.executescript(
+            """
+            CREATE TABLE employees (emp_id TEXT, first_name TEXT, last_name TEXT);
+            CREATE TABLE service_types (service_type_id TEXT, code TEXT);
+            CREATE TABLE clients (
+                client_id TEXT, short_code TEXT, employee_id TEXT, first_name TEXT, last_name TEXT,
+                service_type TEXT, allowed_travel_time REAL, allowed_direct_effort REAL,
+                allowed_indirect_effort REAL, end_date TEXT, is_active INTEGER
+            );
+            INSERT INTO employees VALUES ('E1', 'Eva', 'Beispiel');
+            INSERT INTO service_types VALUES ('1', 'SPF');
+            INSERT INTO clients VALUES ('C1', 'AB', 'E1', 'Anna', 'Muster', '1', 1, 10, 2, NULL, 1);
+            INSERT INTO clients VALUES ('C2', 'CD', 'E1', 'Ben', 'Ohne', '1', NULL, 5, NULL, NULL, NULL);
+            INSERT INTO clients VALUES ('C3', 'EF', 'E1', 'Cleo', 'Alt', '1', 1, 1, 1, '2025-12-31', 1);
+            """
+        )
+
+
+def _processor(project: Path) -> TimeSheetBatchProcessor:
+    config = Config(project)
+    _create_db(config.get_db_path())
+    return TimeSheetBatchProcessor(config, reporting_factory=None)  # type: ignore[arg-type]
+
+
+def test_active_clients_are_loaded(project: Path):
+    headers = _processor(project).load_client_data("2026-01")
+    assert [header.client_id for header in headers] == ["C1", "C2"]
+    first, second = headers
+    assert first.allowed_hours_per_month == 13
+    assert (first.employee_first_name, first.client_last_name) == ("Eva", "Muster")
+    assert second.allowed_hours_per_month == 5
+
+
+def test_invalid_rows_are_skipped(project: Path):
+    processor = _processor(project)
+    with sqlite3.connect(processor.db_path) as conn:
+        conn.execute("INSERT INTO clients VALUES ('C4', NULL, 'E1', 'Dora', 'Defekt', '1', 1, 1, 1, NULL, 1)")
+    headers = processor.load_client_data("2026-01")
+    # C4 hat kein short_code und wird übersprungen, die übrigen Zeilen bleiben erhalten
+    assert [header.client_id for header in headers] == ["C1", "C2"]
+
+
+def test_missing_employee_yields_empty_names(project: Path):
+    processor = _processor(project)
+    with sqlite3.connect(processor.db_path) as conn:
+        conn.execute("INSERT INTO clients VALUES ('C5', 'GH', 'E9', 'Emil', 'Neu', '1', 0, 4, 0, NULL, 1)")
+    headers = processor.load_client_data("2026-01")
+    assert [header.client_id for header in headers] == ["C1", "C2", "C5"]
+    assert headers[-1].employee_first_name is None
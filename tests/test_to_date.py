@@ -0,0 +1,30 @@
+"""
+Tests für to_date (Datumsformate aus freien Texteingaben).
+"""
+
+from datetime import date, datetime
+
+import pytest
+
+from shared_modules.utils import to_date
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2026-01-15", date(2026, 1, 15)),
+        ("2026-1-5", date(2026, 1, 5)),
+        ("15.01.2026", date(2026, 1, 15)),
+        (" 1.2.2026 ", date(2026, 2, 1)),
+        ("2026/01/15", date(2026, 1, 15)),
+        ("01.2026", date(2026, 1, 1)),
+        (datetime(2026, 3, 4, 12, 0), date(2026, 3, 4)),
+    ],
+)
+def test_supported_formats(value, expected):
+    assert to_date(value) == expected
+
+
+@pytest.mark.parametrize("value", ["31.02.2026", "00.01.2026", "20260115", "2026-W03-1", "1.2.26", "", None])
+def test_invalid_values(value):
+    assert to_date(value) is None
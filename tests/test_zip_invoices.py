@@ -0,0 +1,30 @@
+"""
+Tests für zip_invoices (Archivierung der Rechnungs-PDFs).
+"""
+
+from pathlib import Path
+from zipfile import ZipFile
+
+import pytest
+
+from shared_modules.utils import zip_invoices
+
+
+def test_archive_contains_all_files(tmp_path: Path):
+    pdf_files = [tmp_path / "a.pdf", tmp_path / "b.pdf"]
+    for pdf in pdf_files:
+        pdf.write_bytes(b"%PDF-1.4")
+    zip_path = tmp_path / "rechnungen.zip"
+    zip_invoices(pdf_files, zip_path)
+    with ZipFile(zip_path) as zipf:
+        assert zipf.namelist() == ["a.pdf", "b.pdf"]
+
+
+def test_all_missing_files_reported(tmp_path: Path):
+    present = tmp_path / "a.pdf"
+    present.write_bytes(b"%PDF-1.4")
+    zip_path = tmp_path / "rechnungen.zip"
+    with pytest.raises(FileNotFoundError) as exc_info:
+        zip_invoices([present, tmp_path / "x.pdf", tmp_path / "y.pdf"], zip_path)
+    assert "x.pdf" in str(exc_info.value) and "y.pdf" in str(exc_info.value)
+    assert not zip_path.exists()